@@ -8,7 +8,8 @@ It includes:
 - User profile synchronization
 """
 
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -86,7 +87,7 @@ def initialize_auth() -> None:
 
 
 async def create_or_update_user_profile(
-    firebase_user_info: Dict[str, Any]
+    firebase_user_info: Dict[str, Any],
 ) -> Dict[str, Any]:
     """Create or update user profile in Firestore.
 
@@ -102,6 +103,38 @@ async def create_or_update_user_profile(
 
 # --- Firebase User Authentication ---
 
+# Authenticated users are reused for a short window per raw token, so repeat
+# requests skip token verification and the Firestore profile sync
+_USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE_MAX_ENTRIES = 10_000
+# token -> (user, monotonic time after which the token is verified again)
+_user_cache: Dict[str, Tuple[User, float]] = {}
+
+
+def _get_cached_user(token: str) -> Optional[User]:
+    """Returns the cached user for a token if its entry is still fresh."""
+    entry = _user_cache.get(token)
+    if entry is None:
+        return None
+    user, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _user_cache.pop(token, None)
+        return None
+    return user
+
+
+def _cache_user(token: str, user: User, token_exp: Optional[float]) -> None:
+    """Caches a user for the TTL, never past the token's own expiry."""
+    ttl = _USER_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        ttl = min(ttl, token_exp - time.time())
+    if ttl <= 0:
+        return
+    if len(_user_cache) >= _USER_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so this drops the oldest entry
+        _user_cache.pop(next(iter(_user_cache)), None)
+    _user_cache[token] = (user, time.monotonic() + ttl)
+
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     """Get the current user from Firebase ID token.
@@ -123,6 +156,10 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached_user = _get_cached_user(token)
+    if cached_user is not None:
+        return cached_user
+
     try:
         # Main play: verify Firebase token
         decoded_token = verify_firebase_token(token)
@@ -138,6 +175,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
             email_verified=firebase_user_info.get("email_verified", False),
             is_admin=user_profile.get("isAdmin", False),
         )
+        _cache_user(token, user, decoded_token.get("exp"))
         return user
 
     except HTTPException:
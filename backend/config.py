@@ -1,4 +1,12 @@
 # config.py
+"""Application settings read from environment variables.
+
+Settings are validated once per process by the cached get_settings(); the
+module-level ``settings`` is that same instance. Code that changes the
+environment afterwards must call ``get_settings.cache_clear()`` to see it.
+"""
+
+import functools
 from typing import Optional
 
 from pydantic import Field
@@ -7,10 +15,6 @@ from pydantic_settings import (  # Import SettingsConfigDict
     SettingsConfigDict,
 )
 
-# *** REMOVED: dotenv loading is no longer needed here ***
-# from dotenv import load_dotenv
-# load_dotenv()
-
 
 class Settings(BaseSettings):
     """
@@ -144,8 +148,14 @@ class Settings(BaseSettings):
     )
 
 
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment only once."""
+    return Settings()
+
+
 # Create a single instance of the settings to be imported elsewhere
-settings = Settings()
+settings = get_settings()
 
 # Example usage (optional, for testing):
 if __name__ == "__main__":
@@ -8,7 +8,7 @@ This module provides Firebase authentication functionality including:
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import firebase_admin
 from fastapi import HTTPException, status
@@ -21,6 +21,11 @@ logger = logging.getLogger(__name__)
 # Global Firebase app instance - initialized once per process
 _firebase_app: Optional[firebase_admin.App] = None
 
+# Token verification errors, resolved once at import for the except clauses
+_EXPIRED_EXC = auth.ExpiredIdTokenError
+_REVOKED_EXC = auth.RevokedIdTokenError
+_INVALID_EXC = auth.InvalidIdTokenError
+
 
 def initialize_firebase() -> firebase_admin.App:
     """Initialize Firebase Admin SDK with service account credentials.
@@ -81,7 +86,7 @@ def initialize_firebase() -> firebase_admin.App:
         ) from e
 
 
-def verify_firebase_token(id_token: str) -> Dict[str, any]:
+def verify_firebase_token(id_token: str) -> Dict[str, Any]:
     """Verify a Firebase ID token and return decoded payload.
 
     Args:
@@ -105,21 +110,21 @@ def verify_firebase_token(id_token: str) -> Dict[str, any]:
         )
         return decoded_token
 
-    except firebase_admin.auth.ExpiredIdTokenError as e:
+    except _EXPIRED_EXC as e:
         logger.warning(f"Expired Firebase token provided: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
-    except firebase_admin.auth.RevokedIdTokenError as e:
+    except _REVOKED_EXC as e:
         logger.warning(f"Revoked Firebase token provided: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication token has been revoked",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
-    except firebase_admin.auth.InvalidIdTokenError as e:
+    except _INVALID_EXC as e:
         logger.warning(f"Invalid Firebase token provided: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -138,7 +143,7 @@ def verify_firebase_token(id_token: str) -> Dict[str, any]:
         ) from e
 
 
-def extract_user_info(decoded_token: Dict[str, any]) -> Dict[str, any]:
+def extract_user_info(decoded_token: Dict[str, Any]) -> Dict[str, Any]:
     """Extract user information from a decoded Firebase token.
 
     Args:
@@ -1,14 +1,17 @@
 # routers/items.py
-import asyncio  # Ensure asyncio is imported if gather is used
+import asyncio
 import logging
-from typing import List
+from typing import AsyncIterator, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from auth import User, get_current_active_user
 from models import HTTPValidationError  # Import error models
 from models import (
     HTTPError,
+    PhotoResponse,
     PotteryItem,
     PotteryItemBase,
     PotteryItemCreate,
@@ -17,6 +20,12 @@ from models import (
 from services import firestore_service, gcs_service
 
 logger = logging.getLogger(__name__)
+
+# Items whose photos are signed together before being streamed to the client
+_STREAM_CHUNK_SIZE = 16
+# Built once so each streamed chunk is serialized in a single pydantic-core call
+_ITEM_LIST_ADAPTER = TypeAdapter(List[PotteryItemResponse])
+
 router = APIRouter(
     prefix="/api/items",
     tags=["Items"],  # Tag for OpenAPI documentation grouping
@@ -74,16 +83,68 @@ async def _get_item_or_404(item_id: str, user_id: str) -> PotteryItem:
         )
 
 
+def _build_item_response(
+    item: PotteryItem, photo_responses: List[PhotoResponse]
+) -> PotteryItemResponse:
+    """Helper to build the response model from an item and its signed photos.
+
+    The item was validated when it was loaded and the photo responses are built
+    by gcs_service, so the response is assembled with model_construct instead
+    of being dumped and validated a second time.
+    """
+    item_response_data = dict(item)  # Shallow field copy, no serialization walk
+    item_response_data["photos"] = (
+        photo_responses  # Replace internal photos with response photos
+    )
+    return PotteryItemResponse.model_construct(**item_response_data)
+
+
 async def _create_item_response(item: PotteryItem) -> PotteryItemResponse:
     """Helper to convert internal item model to response model with signed URLs."""
     # Generate signed URLs for the photos associated with the item
     photo_responses = await gcs_service.generate_signed_urls_for_photos(item.photos)
-    # Create the response model
-    item_response_data = item.model_dump()
-    item_response_data["photos"] = (
-        photo_responses  # Replace internal photos with response photos
-    )
-    return PotteryItemResponse(**item_response_data)
+    return _build_item_response(item, photo_responses)
+
+
+async def _stream_items(
+    items: List[PotteryItem], first_photo_responses: List[List[PhotoResponse]]
+) -> AsyncIterator[bytes]:
+    """Yields the items as one JSON array, signing photos a chunk at a time.
+
+    ``first_photo_responses`` holds the already signed photos of the first
+    chunk, so the client gets bytes without waiting for the whole list.
+    """
+    yield b"["
+    photo_responses = first_photo_responses
+    for start in range(0, len(items), _STREAM_CHUNK_SIZE):
+        chunk = items[start : start + _STREAM_CHUNK_SIZE]
+        if start:
+            try:
+                photo_responses = await gcs_service.generate_signed_urls_batch(
+                    [item.photos for item in chunk]
+                )
+            except Exception as e:
+                # The 200 status is already sent, so send this chunk's photos
+                # without URLs rather than cutting the JSON array short
+                logger.error(
+                    f"Error signing photos for items {start}-{start + len(chunk) - 1} "
+                    f"while streaming get_items: {e}",
+                    exc_info=True,
+                )
+                photo_responses = [
+                    gcs_service.build_unsigned_photo_responses(item.photos)
+                    for item in chunk
+                ]
+        chunk_json = _ITEM_LIST_ADAPTER.dump_json(
+            [
+                _build_item_response(item, photos)
+                for item, photos in zip(chunk, photo_responses)
+            ]
+        )
+        if start:
+            yield b","
+        yield chunk_json[1:-1]  # Splice the chunk's items into the outer array
+    yield b"]"
 
 
 # --- API Endpoints ---
@@ -91,14 +152,18 @@ async def _create_item_response(item: PotteryItem) -> PotteryItemResponse:
 
 @router.get(
     "/",
-    response_model=List[PotteryItemResponse],
+    response_class=StreamingResponse,
+    response_model=None,
     summary="List User's Pottery Items",
     description=(
         "Retrieves a list of pottery items belonging to the authenticated user, "
         "including temporary signed URLs for photos."
     ),
     responses={
-        status.HTTP_200_OK: {"description": "Successful Response"},
+        status.HTTP_200_OK: {
+            "model": List[PotteryItemResponse],
+            "description": "Successful Response",
+        },
         status.HTTP_401_UNAUTHORIZED: {
             "model": HTTPError,
             "description": "Not authenticated",
@@ -113,15 +178,20 @@ async def _create_item_response(item: PotteryItem) -> PotteryItemResponse:
 async def get_items(current_user: User = Depends(get_current_active_user)):
     """
     Retrieves pottery items belonging to the authenticated user from Firestore
-    and generates signed URLs for their photos.
+    and streams them back as their photos' signed URLs are generated.
     """
     try:
         # Filter items by the current user's username
         items = await firestore_service.get_all_items(user_id=current_user.username)
-        # Convert each item to its response model with signed URLs using asyncio.gather
-        response_tasks = [_create_item_response(item) for item in items]
-        response_items = await asyncio.gather(*response_tasks)
-        return response_items
+        # Sign the first chunk before streaming, so service errors still map
+        # to a 503/500 response
+        first_photo_responses = await gcs_service.generate_signed_urls_batch(
+            [item.photos for item in items[:_STREAM_CHUNK_SIZE]]
+        )
+        return StreamingResponse(
+            _stream_items(items, first_photo_responses),
+            media_type="application/json",
+        )
     except ConnectionError as e:
         logger.error(f"Service connection error in get_items: {e}", exc_info=True)
         raise HTTPException(
@@ -447,71 +517,60 @@ async def delete_item(
 
     gcs_paths_to_delete = [photo.gcsPath for photo in item.photos if photo.gcsPath]
 
-    # 2. Delete photos from GCS
+    # 2. Delete the Firestore document and the GCS photos concurrently; the
+    # two are independent once the photo paths are known
+    delete_tasks = [
+        firestore_service.delete_item_and_photos(item_id, user_id=current_user.username)
+    ]
     if gcs_paths_to_delete:
-        try:
-            gcs_delete_success = await gcs_service.delete_multiple_photos_from_gcs(
-                gcs_paths_to_delete
-            )
-            if not gcs_delete_success:
-                logger.error(
-                    f"Failed to delete one or more GCS photos for item {item_id}."
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to delete associated photos from storage.",
-                )
-        except ConnectionError as e:
-            logger.error(
-                f"GCS connection error during photo deletion for item {item_id}: {e}",
-                exc_info=True,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Storage service unavailable.",
-            )
-        except Exception as e:
-            logger.error(
-                f"Unexpected error deleting GCS photos for item {item_id}: {e}",
-                exc_info=True,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Error during photo deletion.",
-            )
-
-    # 3. Delete item from Firestore (pass user_id to ensure ownership check)
-    try:
-        firestore_delete_success = await firestore_service.delete_item_and_photos(
-            item_id, user_id=current_user.username
+        delete_tasks.append(
+            gcs_service.delete_multiple_photos_from_gcs(gcs_paths_to_delete)
         )
-        if not firestore_delete_success:
-            logger.error(f"Firestore failed to delete item document {item_id}.")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete item metadata after deleting photos.",
-            )
-
-        logger.info(f"Successfully deleted item {item_id} and associated photos.")
-        return None  # Return None for 204
+    firestore_result, *gcs_results = await asyncio.gather(
+        *delete_tasks, return_exceptions=True
+    )
 
-    except ConnectionError as e:
+    # 3. The Firestore outcome decides the response, since the item still
+    # exists (and can be deleted again) if that step failed
+    if isinstance(firestore_result, ConnectionError):
         logger.error(
-            f"Firestore connection error during item deletion for {item_id}: {e}",
-            exc_info=True,
+            f"Firestore connection error during item deletion for {item_id}: "
+            f"{firestore_result}",
+            exc_info=firestore_result,
         )
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database service unavailable.",
         )
-    except HTTPException as http_exc:
-        raise http_exc  # Re-raise exceptions (e.g., from GCS step)
-    except Exception as e:
+    # BaseException, so a cancelled delete (CancelledError) is not read as
+    # success
+    if isinstance(firestore_result, BaseException):
         logger.error(
-            f"Unexpected error deleting item {item_id} from Firestore: {e}",
-            exc_info=True,
+            f"Unexpected error deleting item {item_id} from Firestore: "
+            f"{firestore_result}",
+            exc_info=firestore_result,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete item metadata.",
         )
+    if not firestore_result:
+        logger.error(f"Firestore failed to delete item document {item_id}.")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete item metadata.",
+        )
+
+    # 4. The item is gone, so a GCS failure is not rolled back; log the
+    # leftover paths so the orphaned objects can be cleaned up
+    if gcs_results and gcs_results[0] is not True:
+        gcs_error = (
+            gcs_results[0] if isinstance(gcs_results[0], BaseException) else None
+        )
+        logger.error(
+            f"Orphaned GCS photos for deleted item {item_id}: {gcs_paths_to_delete}",
+            exc_info=gcs_error,
+        )
+
+    logger.info(f"Successfully deleted item {item_id} and associated photos.")
+    return None  # Return None for 204
@@ -1,7 +1,11 @@
 # services/gcs_service.py
+import asyncio
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
@@ -17,6 +21,19 @@ _bucket = None
 _initialization_attempted = False
 _initialization_error = None
 
+# Signed URLs are reused until 90% of their lifetime has passed, so a cached
+# URL handed out still has at least 10% of its validity left
+_SIGNED_URL_REUSE_FRACTION = 0.9
+_SIGNED_URL_CACHE_MAX_ENTRIES = 10_000
+# gcs_path -> (signed_url, monotonic time after which it is re-signed)
+_signed_url_cache: Dict[str, Tuple[str, float]] = {}
+
+# V4 signing is synchronous CPU work (RSA), so it runs here instead of on the
+# event loop
+_sign_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="gcs-sign"
+)
+
 
 def _ensure_gcs_client():
     """Ensure GCS client is initialized. Raises ConnectionError if failed."""
@@ -45,6 +62,30 @@ def _ensure_gcs_client():
         raise ConnectionError(f"GCS client initialization failed: {e}")
 
 
+def _get_cached_signed_url(gcs_path: str) -> Optional[str]:
+    """Returns a still-fresh cached signed URL for the path, if any."""
+    entry = _signed_url_cache.get(gcs_path)
+    if entry is None:
+        return None
+    url, reuse_until = entry
+    if time.monotonic() >= reuse_until:
+        _signed_url_cache.pop(gcs_path, None)
+        return None
+    return url
+
+
+def _cache_signed_url(gcs_path: str, url: str) -> None:
+    """Caches a freshly signed URL for most of its lifetime."""
+    if len(_signed_url_cache) >= _SIGNED_URL_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so this drops the oldest entry
+        _signed_url_cache.pop(next(iter(_signed_url_cache)), None)
+    lifetime = settings.signed_url_expiration_minutes * 60
+    _signed_url_cache[gcs_path] = (
+        url,
+        time.monotonic() + lifetime * _SIGNED_URL_REUSE_FRACTION,
+    )
+
+
 def _get_gcs_path(
     item_id: str, photo_id: str, original_filename: Optional[str] = None
 ) -> str:
@@ -106,6 +147,7 @@ async def upload_photo_to_gcs(
 async def delete_photo_from_gcs(gcs_path: str) -> bool:
     """Deletes a photo object from GCS."""
     storage_client, bucket = _ensure_gcs_client()
+    _signed_url_cache.pop(gcs_path, None)
 
     blob = bucket.blob(gcs_path)
     try:
@@ -126,6 +168,34 @@ async def delete_photo_from_gcs(gcs_path: str) -> bool:
         return False  # Indicate failure
 
 
+def _delete_blobs(bucket, gcs_paths: List[str]) -> bool:
+    """Deletes each GCS path one by one; False if any delete failed.
+
+    Blocking, so it is meant to run in a worker thread.
+    """
+    all_succeeded = True
+    for gcs_path in gcs_paths:
+        blob = bucket.blob(gcs_path)
+        try:
+            blob.delete()
+            logger.info(
+                f"Deleted photo from GCS path: {gcs_path} (or it didn't exist)."
+            )
+        except NotFound:
+            logger.warning(
+                f"Photo not found at GCS path: {gcs_path} during batch delete."
+            )
+            continue  # Continue with others
+        except Exception as e:
+            logger.error(
+                f"Error deleting photo from GCS path {gcs_path} during batch "
+                f"delete: {e}",
+                exc_info=True,
+            )
+            all_succeeded = False  # Mark failure if any single delete fails
+    return all_succeeded
+
+
 async def delete_multiple_photos_from_gcs(gcs_paths: List[str]) -> bool:
     """Deletes multiple photo objects from GCS. Returns True if all
     deletions succeeded or blobs didn't exist.
@@ -134,33 +204,13 @@ async def delete_multiple_photos_from_gcs(gcs_paths: List[str]) -> bool:
     if not gcs_paths:
         return True  # Nothing to delete
 
-    all_succeeded = True
-    try:
-        # GCS client library allows batch deletion for efficiency
-        # bucket.delete_blobs(gcs_paths) # Use sync version
-        # For async, might need individual deletes or run sync in executor
-
-        # Simple loop with individual deletes (sync, may block):
-        for gcs_path in gcs_paths:
-            blob = bucket.blob(gcs_path)
-            try:
-                blob.delete()
-                logger.info(
-                    f"Deleted photo from GCS path: {gcs_path} (or it didn't exist)."
-                )
-            except NotFound:
-                logger.warning(
-                    f"Photo not found at GCS path: {gcs_path} during batch delete."
-                )
-                continue  # Continue with others
-            except Exception as e:
-                logger.error(
-                    f"Error deleting photo from GCS path {gcs_path} during batch "
-                    f"delete: {e}",
-                    exc_info=True,
-                )
-                all_succeeded = False  # Mark failure if any single delete fails
+    for gcs_path in gcs_paths:
+        _signed_url_cache.pop(gcs_path, None)
 
+    try:
+        # blob.delete() is synchronous, so the deletes run in a worker thread
+        # to leave the event loop free for other requests
+        all_succeeded = await asyncio.to_thread(_delete_blobs, bucket, gcs_paths)
         logger.info(f"Attempted batch deletion for {len(gcs_paths)} GCS paths.")
         return all_succeeded
     except Exception as e:
@@ -168,96 +218,156 @@ async def delete_multiple_photos_from_gcs(gcs_paths: List[str]) -> bool:
         return False
 
 
-async def generate_signed_url(gcs_path: str) -> Optional[str]:
-    """Generates a temporary signed URL for accessing a GCS object."""
-    storage_client, bucket = _ensure_gcs_client()
+def _sign_batch(
+    bucket, gcs_paths: List[str], expiration_time: timedelta
+) -> List[Optional[str]]:
+    """Signs each GCS path with the V4 process; None for paths that failed.
 
-    blob = bucket.blob(gcs_path)
+    Blocking, so it is meant to run in ``_sign_executor``.
+    """
+    urls = []
+    for gcs_path in gcs_paths:
+        try:
+            # generate_signed_url is synchronous in the current library version
+            url = bucket.blob(gcs_path).generate_signed_url(
+                version="v4",
+                expiration=expiration_time,
+                method="GET",
+            )
+            logger.debug(f"Generated signed URL for GCS path: {gcs_path}")
+        except NotFound:
+            logger.warning(
+                f"Cannot generate signed URL, blob not found at GCS path: {gcs_path}"
+            )
+            url = None
+        except Exception as e:
+            logger.error(
+                f"Error generating signed URL for GCS path {gcs_path}: {e}",
+                exc_info=True,
+            )
+            url = None
+        urls.append(url)
+    return urls
+
+
+async def _sign_gcs_paths(gcs_paths: List[str]) -> Dict[str, Optional[str]]:
+    """Returns a signed URL (or None) per path, signing cache misses off-loop."""
+    signed_urls = {gcs_path: _get_cached_signed_url(gcs_path) for gcs_path in gcs_paths}
+    missing = [gcs_path for gcs_path, url in signed_urls.items() if url is None]
+    if not missing:
+        return signed_urls
+
+    storage_client, bucket = _ensure_gcs_client()
     expiration_time = timedelta(minutes=settings.signed_url_expiration_minutes)
 
-    try:
-        # Check if blob exists before generating URL (optional but good practice)
-        # Note: blob.exists() is a synchronous call. For fully async, this check
-        # might be omitted
-        # or handled differently depending on the library's async capabilities.
-        # if not blob.exists():
-        #     logger.warning(
-        #         f"Cannot generate signed URL, blob not found at GCS path: {gcs_path}"
-        #     )
-        #     return None
-
-        # Generate the signed URL using V4 signing process
-        # generate_signed_url is also synchronous in the current library version.
-        url = blob.generate_signed_url(
-            version="v4",
-            expiration=expiration_time,
-            method="GET",
-        )
-        logger.debug(f"Generated signed URL for GCS path: {gcs_path}")
-        return url
-    except NotFound:
+    loop = asyncio.get_running_loop()
+    urls = await loop.run_in_executor(
+        _sign_executor, _sign_batch, bucket, missing, expiration_time
+    )
+    for gcs_path, url in zip(missing, urls):
+        signed_urls[gcs_path] = url
+        if url is not None:
+            _cache_signed_url(gcs_path, url)
+    return signed_urls
+
+
+async def generate_signed_url(gcs_path: str) -> Optional[str]:
+    """Generates a temporary signed URL for accessing a GCS object.
+
+    URLs are cached in-process per GCS path, so repeat requests for the same
+    photo skip the RSA signing step until the cached URL nears expiry.
+    """
+    signed_urls = await _sign_gcs_paths([gcs_path])
+    return signed_urls[gcs_path]
+
+
+def _build_photo_response(
+    photo: Photo, signed_url: Optional[str]
+) -> Optional[PhotoResponse]:
+    """Builds the PhotoResponse for a photo and its signed URL.
+
+    Returns None if no response model can be built for the photo.
+    """
+    # Log the signed URL for debugging
+    if signed_url:
+        logger.debug(f"Generated signed URL for photo {photo.id}: {signed_url[:50]}...")
+    else:
         logger.warning(
-            f"Cannot generate signed URL, blob not found at GCS path: {gcs_path}"
+            f"Failed to generate signed URL for photo {photo.id} with GCS path "
+            f"{photo.gcsPath}"
         )
-        return None
+
+    # Create a dictionary from the internal Photo model
+    photo_response_data = photo.model_dump()
+
+    # Add the generated signed URL to the dictionary
+    photo_response_data["signedUrl"] = signed_url
+
+    # Remove the internal gcsPath field as it's not part of the PhotoResponse model
+    photo_response_data.pop("gcsPath", None)
+
+    try:
+        # Create a PhotoResponse object from the dictionary
+        return PhotoResponse(**photo_response_data)
     except Exception as e:
+        # Log the error and fall back to a response without the URL
         logger.error(
-            f"Error generating signed URL for GCS path {gcs_path}: {e}", exc_info=True
+            f"Error creating PhotoResponse for photo {photo.id}: {e}", exc_info=True
         )
-        return None  # Return None on error
+        # Try creating a PhotoResponse without the signedUrl
+        photo_response_data["signedUrl"] = None
+        try:
+            photo_response = PhotoResponse(**photo_response_data)
+            logger.info(f"Created PhotoResponse for photo {photo.id} without signedUrl")
+            return photo_response
+        except Exception as e2:
+            logger.error(
+                f"Error creating PhotoResponse without signedUrl for photo "
+                f"{photo.id}: {e2}",
+                exc_info=True,
+            )
+            return None
+
+
+def build_unsigned_photo_responses(photos: List[Photo]) -> List[PhotoResponse]:
+    """Builds PhotoResponse models without signed URLs, for when signing failed."""
+    photo_responses = [_build_photo_response(photo, None) for photo in photos]
+    return [r for r in photo_responses if r is not None]
 
 
 async def generate_signed_urls_for_photos(photos: List[Photo]) -> List[PhotoResponse]:
     """Takes a list of internal Photo models and returns a list of
     PhotoResponse models with signed URLs.
     """
+    # Sign all of the photos' GCS paths in a single executor round trip
+    signed_urls = await _sign_gcs_paths(list(dict.fromkeys(p.gcsPath for p in photos)))
+
     photo_responses = []
     for photo in photos:
-        # Generate signed URL for the current photo's GCS path
-        signed_url = await generate_signed_url(photo.gcsPath)
-
-        # Log the signed URL for debugging
-        if signed_url:
-            logger.debug(
-                f"Generated signed URL for photo {photo.id}: {signed_url[:50]}..."
-            )
-        else:
-            logger.warning(
-                f"Failed to generate signed URL for photo {photo.id} with GCS path "
-                f"{photo.gcsPath}"
-            )
-
-        # Create a dictionary from the internal Photo model
-        photo_response_data = photo.model_dump()
+        photo_response = _build_photo_response(photo, signed_urls[photo.gcsPath])
+        if photo_response is not None:
+            photo_responses.append(photo_response)
 
-        # Add the generated signed URL to the dictionary
-        photo_response_data["signedUrl"] = signed_url
+    return photo_responses
 
-        # Remove the internal gcsPath field as it's not part of the PhotoResponse model
-        photo_response_data.pop("gcsPath", None)
 
-        try:
-            # Create a PhotoResponse object from the dictionary and add it to the list
-            photo_response = PhotoResponse(**photo_response_data)
-            photo_responses.append(photo_response)
-        except Exception as e:
-            # Log the error and continue with the next photo
-            logger.error(
-                f"Error creating PhotoResponse for photo {photo.id}: {e}", exc_info=True
-            )
-            # Try creating a PhotoResponse without the signedUrl
-            photo_response_data["signedUrl"] = None
-            try:
-                photo_response = PhotoResponse(**photo_response_data)
-                photo_responses.append(photo_response)
-                logger.info(
-                    f"Created PhotoResponse for photo {photo.id} without signedUrl"
-                )
-            except Exception as e2:
-                logger.error(
-                    f"Error creating PhotoResponse without signedUrl for photo "
-                    f"{photo.id}: {e2}",
-                    exc_info=True,
-                )
+async def generate_signed_urls_batch(
+    photos_lists: List[List[Photo]],
+) -> List[List[PhotoResponse]]:
+    """Signs the photos of several items in one pass.
 
-    return photo_responses
+    Each distinct GCS path across all lists is signed once, then the
+    PhotoResponse lists are returned in the same order as ``photos_lists``.
+    """
+    gcs_paths = dict.fromkeys(
+        photo.gcsPath for photos in photos_lists for photo in photos
+    )
+    signed_urls = await _sign_gcs_paths(list(gcs_paths))
+
+    batched_responses = []
+    for photos in photos_lists:
+        photo_responses = [
+            _build_photo_response(photo, signed_urls[photo.gcsPath]) for photo in photos
+        ]
+        batched_responses.append([r for r in photo_responses if r is not None])
+    return batched_responses
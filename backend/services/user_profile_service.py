@@ -17,6 +17,12 @@ from services.firestore_service import _ensure_firestore_client
 
 logger = logging.getLogger(__name__)
 
+# Firestore collection holding one profile document per Firebase UID
+USERS_COLLECTION = "users"
+
+# Firestore rejects write batches with more than 500 operations
+MAX_BATCH_WRITES = 500
+
 
 class UserProfileService:
     """Service for managing user profiles in Firestore."""
@@ -28,13 +34,23 @@ class UserProfileService:
             firestore_client_factory: Optional callable that returns (db_client, db_name) tuple.
                                      If None, uses the default _ensure_firestore_client.
         """
-        self.users_collection_name = "users"
+        self.users_collection_name = USERS_COLLECTION
         # Time to tackle the tricky bit: allow dependency injection for testing
         self._firestore_client_factory = (
             firestore_client_factory or _ensure_firestore_client
         )
+        self._db = None
 
-    async def sync_user_profile(self, user_info: Dict[str, any]) -> Dict[str, any]:
+    def _get_db(self):
+        """Return the Firestore client, calling the factory only on first use.
+
+        Every operation then shares one client (and its gRPC channel pool).
+        """
+        if self._db is None:
+            self._db, _ = self._firestore_client_factory()
+        return self._db
+
+    async def sync_user_profile(self, user_info: Dict[str, Any]) -> Dict[str, Any]:
         """Sync Firebase user info to Firestore user profile.
 
         Args:
@@ -112,7 +128,7 @@ class UserProfileService:
             logger.error(f"Error syncing user profile for {user_info.get('uid')}: {e}")
             raise
 
-    async def get_user_profile(self, uid: str) -> Optional[Dict[str, any]]:
+    async def get_user_profile(self, uid: str) -> Optional[Dict[str, Any]]:
         """Get user profile by Firebase UID.
 
         Args:
@@ -126,7 +142,7 @@ class UserProfileService:
         """
         return await self._get_user_profile(uid)
 
-    async def _get_user_profile(self, uid: str) -> Optional[Dict[str, any]]:
+    async def _get_user_profile(self, uid: str) -> Optional[Dict[str, Any]]:
         """Internal method to get user profile from Firestore.
 
         Args:
@@ -137,7 +153,7 @@ class UserProfileService:
         """
         try:
             # Big play: fetch user document from Firestore
-            db, _ = self._firestore_client_factory()
+            db = self._get_db()
             doc_ref = db.collection(self.users_collection_name).document(uid)
             doc = await doc_ref.get()
 
@@ -151,7 +167,7 @@ class UserProfileService:
             raise
 
     async def _create_user_profile(
-        self, uid: str, profile_data: Dict[str, any]
+        self, uid: str, profile_data: Dict[str, Any]
     ) -> None:
         """Internal method to create user profile in Firestore.
 
@@ -160,7 +176,7 @@ class UserProfileService:
             profile_data: User profile data to store
         """
         try:
-            db, _ = self._firestore_client_factory()
+            db = self._get_db()
             doc_ref = db.collection(self.users_collection_name).document(uid)
             await doc_ref.set(profile_data)
 
@@ -169,7 +185,7 @@ class UserProfileService:
             raise
 
     async def _update_user_profile(
-        self, uid: str, profile_data: Dict[str, any]
+        self, uid: str, profile_data: Dict[str, Any]
     ) -> None:
         """Internal method to update user profile in Firestore.
 
@@ -178,7 +194,7 @@ class UserProfileService:
             profile_data: User profile data to update
         """
         try:
-            db, _ = self._firestore_client_factory()
+            db = self._get_db()
             doc_ref = db.collection(self.users_collection_name).document(uid)
             await doc_ref.update(profile_data)
 
@@ -199,7 +215,7 @@ class UserProfileService:
             Exception: If Firestore operation fails
         """
         try:
-            db, _ = self._firestore_client_factory()
+            db = self._get_db()
             doc_ref = db.collection(self.users_collection_name).document(uid)
             doc = await doc_ref.get()
 
@@ -254,6 +270,36 @@ class UserProfileService:
             logger.error(f"Error setting admin status for {uid}: {e}")
             raise
 
+    async def set_admin_status_bulk(self, admin_flags: Dict[str, bool]) -> None:
+        """Set admin status for many users with batched writes.
+
+        Updates are committed in Firestore write batches of up to
+        MAX_BATCH_WRITES operations instead of one round-trip per user.
+
+        Args:
+            admin_flags: Mapping of Firebase user ID to admin flag
+        """
+        try:
+            db = self._get_db()
+            users = db.collection(self.users_collection_name)
+            updated_at = datetime.utcnow()
+            flags = list(admin_flags.items())
+
+            for start in range(0, len(flags), MAX_BATCH_WRITES):
+                batch = db.batch()
+                for uid, is_admin in flags[start : start + MAX_BATCH_WRITES]:
+                    batch.update(
+                        users.document(uid),
+                        {"isAdmin": is_admin, "updatedAt": updated_at},
+                    )
+                await batch.commit()
+
+            logger.info(f"Set admin status for {len(flags)} users")
+
+        except Exception as e:
+            logger.error(f"Error setting admin status in bulk: {e}")
+            raise
+
 
 # Global service instance
 _user_profile_service: Optional[UserProfileService] = None
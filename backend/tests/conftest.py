@@ -1,8 +1,13 @@
 # tests/conftest.py
+import copy
 import os
 import sys
-from unittest.mock import Mock, patch
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from typing import Mapping
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import httpx
 import pytest
 
 # *** ADDED: Import load_dotenv ***
@@ -95,6 +100,9 @@ except ImportError as e:
 def client() -> TestClient:
     """
     Create a FastAPI TestClient instance for the session.
+
+    Session scope runs the app lifespan (startup/shutdown) once for the whole
+    run instead of once per test or module.
     """
     print("Creating TestClient...")
     try:
@@ -106,6 +114,218 @@ def client() -> TestClient:
         pytest.fail(f"Failed to create TestClient: {e}")
 
 
+@pytest.fixture(scope="session")
+async def async_client() -> httpx.AsyncClient:
+    """
+    Create an httpx AsyncClient that calls the app in-process for the session.
+
+    ASGITransport dispatches straight into the app on the session event loop,
+    skipping the thread portal TestClient uses for every request.
+    """
+    transport = httpx.ASGITransport(app=fastapi_app)
+    # follow_redirects matches TestClient (e.g. /api/items -> /api/items/)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test", follow_redirects=True
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _session_user_profile_service():
+    """
+    Swap auth_firebase's module-level UserProfileService for one shared Mock.
+
+    Patching once per session avoids a patch start/stop cycle in every test
+    that touches the profile service.
+    """
+    import auth_firebase
+
+    real_service = auth_firebase.user_profile_service
+    auth_firebase.user_profile_service = Mock()
+    yield auth_firebase.user_profile_service
+    auth_firebase.user_profile_service = real_service
+
+
+@pytest.fixture(autouse=True)
+def mock_user_service(_session_user_profile_service):
+    """Reset and return the shared UserProfileService mock for each test."""
+    _session_user_profile_service.reset_mock(return_value=True, side_effect=True)
+    return _session_user_profile_service
+
+
+class _FrozenUtcDatetime(datetime):
+    """datetime whose utcnow() always returns the session's frozen instant."""
+
+    @classmethod
+    def utcnow(cls):
+        return datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def frozen_utcnow():
+    """
+    Freeze the clock UserProfileService stamps profiles with.
+
+    Opt-in: only modules whose tests request it see the frozen clock, and it
+    is restored when that module finishes, so integration runs write real
+    timestamps. Returns the frozen instant so tests can assert
+    createdAt/updatedAt exactly.
+    """
+    with patch("services.user_profile_service.datetime", _FrozenUtcDatetime):
+        yield _FrozenUtcDatetime.utcnow()
+
+
+def _is_integration_module(request) -> bool:
+    """True when the requesting test module lives under tests/integration."""
+    return "integration" in request.path.parent.parts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _preinit_firebase(request):
+    """
+    Mark the Firebase Admin app as already initialized for each unit test module.
+
+    initialize_firebase() returns early once ``_firebase_app`` is set, so no
+    unit test needs to patch it just to keep the real SDK from starting up.
+    Integration modules are left alone so they initialize the real app, and
+    module scope means the fake app never outlives the unit modules.
+    """
+    if _is_integration_module(request):
+        yield None
+        return
+
+    import core.firebase
+
+    real_app = core.firebase._firebase_app
+    core.firebase._firebase_app = Mock()
+    yield core.firebase._firebase_app
+    core.firebase._firebase_app = real_app
+
+
+@pytest.fixture
+def mock_firebase_sdk(monkeypatch, _preinit_firebase):
+    """
+    Mock the Firebase Admin auth module used by core.firebase.
+
+    Returns a namespace with ``auth`` and ``app`` so tests configure e.g.
+    ``mock_firebase_sdk.auth.verify_id_token.return_value`` directly.
+    """
+    sdk = SimpleNamespace(auth=MagicMock(), app=_preinit_firebase)
+    monkeypatch.setattr("core.firebase.auth", sdk.auth)
+    return sdk
+
+
+@pytest.fixture(scope="session")
+def _firestore_mock_template():
+    """
+    Build one wired Firestore client -> document mock graph for the session.
+
+    ``db.collection(...).document(...)`` returns ``doc_ref``, awaiting
+    ``doc_ref.get()`` returns ``doc`` and ``db.batch()`` returns ``batch``.
+    Tests use it through ``firestore_mocks``.
+    """
+    db = Mock()
+    doc = Mock(exists=False)
+    doc_ref = Mock(
+        get=AsyncMock(return_value=doc),
+        set=AsyncMock(),
+        update=AsyncMock(),
+        delete=AsyncMock(),
+    )
+    batch = Mock(commit=AsyncMock())
+    db.collection.return_value.document.return_value = doc_ref
+    db.batch.return_value = batch
+    return SimpleNamespace(db=db, doc_ref=doc_ref, doc=doc, batch=batch)
+
+
+@pytest.fixture
+def firestore_mocks(_firestore_mock_template):
+    """
+    Per-test view of the shared Firestore mock graph.
+
+    Tests adjust ``doc.exists``, ``doc.to_dict`` and the ``doc_ref`` side
+    effects they need; calls and configuration are reset afterwards while the
+    client -> document wiring is kept.
+    """
+    mocks = copy.copy(_firestore_mock_template)
+    yield mocks
+    # Calls only: return_value=True here would drop the collection/document wiring
+    mocks.db.reset_mock()
+    doc_ref = mocks.doc_ref
+    for method in (doc_ref.get, doc_ref.set, doc_ref.update, doc_ref.delete):
+        method.reset_mock(return_value=True, side_effect=True)
+    mocks.batch.commit.reset_mock(return_value=True, side_effect=True)
+    mocks.doc.reset_mock(return_value=True, side_effect=True)
+    mocks.doc.exists = False
+    mocks.doc_ref.get.return_value = mocks.doc
+
+
+@pytest.fixture
+def make_firestore_mocks(firestore_mocks):
+    """
+    Configure the shared Firestore mocks for a single document read.
+
+    Returns a factory taking ``exists``, the ``to_dict`` ``payload`` and an
+    optional ``get_error``. It hands back the wired ``(db, doc_ref, doc)`` so
+    tests bind them once instead of walking the mock chain.
+    """
+
+    def configure(exists=False, payload=None, get_error=None):
+        doc_ref, doc = firestore_mocks.doc_ref, firestore_mocks.doc
+        doc.exists = exists
+        doc.to_dict.return_value = payload
+        doc_ref.get.side_effect = get_error
+        return firestore_mocks.db, doc_ref, doc
+
+    return configure
+
+
+@pytest.fixture(autouse=True)
+def _clear_user_cache():
+    """
+    Empty auth's token -> user cache after every test.
+
+    Tests reuse the same bearer tokens with different mocked users, so a
+    cached user would otherwise skip the next test's token mocks.
+    """
+    import auth
+
+    yield
+    auth._user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_dependency_overrides():
+    """
+    Clear app.dependency_overrides after every test.
+
+    The app is shared by the session-scoped clients, so an override left
+    behind by one test would leak into every later request.
+    """
+    yield
+    fastapi_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def override_auth(mock_firebase_user):
+    """
+    Resolve get_current_user to a fixed User via app.dependency_overrides.
+
+    Routes then run their real dependency chain (e.g. get_current_active_user)
+    on top of that user without any token verification. Returns a setter so a
+    test can swap in a specific User; the override is removed afterwards.
+    """
+    from auth import User, get_current_user
+
+    def set_user(user: User) -> User:
+        fastapi_app.dependency_overrides[get_current_user] = lambda: user
+        return user
+
+    set_user(User(**mock_firebase_user))
+    yield set_user
+    fastapi_app.dependency_overrides.pop(get_current_user, None)
+
+
 # Optional: Fixture for base API URL prefix if needed elsewhere
 @pytest.fixture(scope="session")
 def api_prefix() -> str:
@@ -114,8 +334,9 @@ def api_prefix() -> str:
 
 # Optional: Fixture for common headers
 @pytest.fixture(scope="session")
-def common_headers() -> dict:
-    return {"Content-Type": "application/json"}
+def common_headers() -> Mapping[str, str]:
+    # Read-only: one session-wide mapping is shared by every test that uses it
+    return MappingProxyType({"Content-Type": "application/json"})
 
 
 # Authentication fixtures
@@ -159,7 +380,9 @@ def mock_firebase_auth(request, mock_firebase_user, mock_firebase_token):
 
     with patch("auth.verify_firebase_token") as mock_verify:
         with patch("auth.extract_user_info") as mock_extract:
-            with patch("auth.create_or_update_user_profile") as mock_profile:
+            with patch(
+                "auth.create_or_update_user_profile", new_callable=AsyncMock
+            ) as mock_profile:
                 # Import settings here to avoid circular import issues
                 from config import settings
 
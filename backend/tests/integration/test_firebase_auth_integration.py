@@ -308,20 +308,16 @@ class TestFirebaseAuthenticationIntegration:
 class TestFirebaseAuthEndToEnd:
     """End-to-end tests for Firebase authentication."""
 
-    @patch("core.firebase.initialize_firebase")
     @patch("auth.verify_firebase_token")
     @patch("auth.get_user_profile_service")
     def test_complete_authentication_flow(
         self,
         mock_user_service,
         mock_verify_token,
-        mock_init_firebase,
         client: TestClient,
     ):
         """Test complete authentication flow from token to response."""
         # Opening move: setup all Firebase components
-        mock_init_firebase.return_value = "mocked_firebase_app"
-
         token_data = VALID_FIREBASE_TOKEN.to_dict()
         mock_verify_token.return_value = token_data
 
@@ -59,7 +59,6 @@ def update_item_payload(original_payload):
 
 # *** ADDED MARKER ***
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_item_create_get_delete_cycle(
     client: TestClient, resource_manager, auth_headers
 ):
@@ -115,7 +114,6 @@ async def test_item_create_get_delete_cycle(
 
 # *** ADDED MARKER ***
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_item_update_cycle(client: TestClient, resource_manager, auth_headers):
     """Tests creating, updating, and verifying update of an item."""
     created_item_ids, _ = resource_manager
@@ -160,7 +158,6 @@ async def test_item_update_cycle(client: TestClient, resource_manager, auth_head
 
 # *** ADDED MARKER ***
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_get_nonexistent_item(client: TestClient, auth_headers):
     """Test getting an item that does not exist."""
     non_existent_id = str(uuid.uuid4())
@@ -170,7 +167,6 @@ async def test_get_nonexistent_item(client: TestClient, auth_headers):
 
 # *** ADDED MARKER ***
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_photo_upload_get_delete_cycle(
     client: TestClient, resource_manager, auth_headers
 ):
@@ -289,7 +285,6 @@ async def test_photo_upload_get_delete_cycle(
 
 # *** ADDED MARKER ***
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_photo_update_details(client: TestClient, resource_manager, auth_headers):
     """Tests updating photo metadata (does not involve file upload)."""
     created_item_ids, created_gcs_paths = resource_manager
@@ -7,8 +7,10 @@ This module tests:
 - Error handling scenarios
 """
 
+import re
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 from fastapi import HTTPException, status
 
@@ -19,92 +21,98 @@ from auth_firebase import (
     get_current_admin_user,
     get_current_user,
 )
+from tests.utils.fastapi_helpers import invalid_token_exc, unauthorized_exc
 from tests.utils.firebase_mocks import (
     ADMIN_FIREBASE_TOKEN,
     VALID_FIREBASE_TOKEN,
+    async_return,
+    create_auth_mock_transport,
     create_firebase_error_scenarios,
     create_mock_firebase_auth,
+    create_test_auth_headers,
 )
 
+# Decoded token payloads shared by the success-path tests
+_VALID_TOKEN_DATA = VALID_FIREBASE_TOKEN.to_dict()
+_ADMIN_TOKEN_DATA = ADMIN_FIREBASE_TOKEN.to_dict()
+
+
+@pytest.fixture(scope="module")
+async def auth_client():
+    """HTTP client whose requests go straight to get_current_user."""
+    transport = create_auth_mock_transport(get_current_user)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
 
 class TestGetCurrentUser:
     """Test the get_current_user dependency function."""
 
-    @patch("auth_firebase.user_profile_service")
+    @pytest.mark.parametrize(
+        "token,token_data,is_admin,display_name",
+        [
+            ("valid_token", _VALID_TOKEN_DATA, False, "Test User"),
+            ("admin_token", _ADMIN_TOKEN_DATA, True, "Admin User"),
+        ],
+        ids=["regular", "admin"],
+    )
     @patch("auth_firebase.verify_firebase_token")
-    async def test_get_current_user_success(self, mock_verify_token, mock_user_service):
-        """Test successful user authentication with valid token."""
+    async def test_get_current_user_success(
+        self,
+        mock_verify_token,
+        mock_user_service,
+        token,
+        token_data,
+        is_admin,
+        display_name,
+    ):
+        """Test successful regular and admin user authentication."""
         # Opening move: setup mocks for successful authentication
-        token_data = VALID_FIREBASE_TOKEN.to_dict()
         mock_verify_token.return_value = token_data
 
         profile_data = {
             "uid": token_data["uid"],
             "email": token_data["email"],
-            "displayName": "Test User",
-            "isAdmin": False,
+            "displayName": display_name,
+            "isAdmin": is_admin,
         }
 
-        mock_user_service.sync_user_profile = AsyncMock(return_value=profile_data)
-        mock_user_service.is_admin_user = AsyncMock(return_value=False)
+        mock_user_service.sync_user_profile = Mock(
+            side_effect=async_return(profile_data)
+        )
+        mock_user_service.is_admin_user = Mock(side_effect=async_return(is_admin))
 
         # Main play: call get_current_user
-        user = await get_current_user("valid_token")
+        user = await get_current_user(token)
 
         # Victory lap: verify the user object is correct
-        assert user.uid == token_data["uid"]
-        assert user.email == token_data["email"]
-        assert user.full_name == "Test User"
-        assert user.disabled is False
-        assert user.is_admin is False
+        assert user == User(
+            uid=token_data["uid"],
+            email=token_data["email"],
+            full_name=display_name,
+            disabled=False,
+            is_admin=is_admin,
+        )
 
         # Verify mocks were called correctly
-        mock_verify_token.assert_called_once_with("valid_token")
+        mock_verify_token.assert_called_once_with(token)
         mock_user_service.sync_user_profile.assert_called_once()
         mock_user_service.is_admin_user.assert_called_once_with(token_data["uid"])
 
-    @patch("auth_firebase.user_profile_service")
-    @patch("auth_firebase.verify_firebase_token")
-    async def test_get_current_user_admin(self, mock_verify_token, mock_user_service):
-        """Test successful admin user authentication."""
-        # Setup admin token data
-        token_data = ADMIN_FIREBASE_TOKEN.to_dict()
-        mock_verify_token.return_value = token_data
-
-        profile_data = {
-            "uid": token_data["uid"],
-            "email": token_data["email"],
-            "displayName": "Admin User",
-            "isAdmin": True,
-        }
-
-        mock_user_service.sync_user_profile = AsyncMock(return_value=profile_data)
-        mock_user_service.is_admin_user = AsyncMock(return_value=True)
-
-        # Test admin authentication
-        user = await get_current_user("admin_token")
-
-        assert user.uid == token_data["uid"]
-        assert user.email == token_data["email"]
-        assert user.is_admin is True
-
     @patch("auth_firebase.verify_firebase_token")
     async def test_get_current_user_invalid_token(self, mock_verify_token):
         """Test authentication failure with invalid token."""
         # Setup mock to raise authentication error
-        mock_verify_token.side_effect = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication token",
-        )
+        mock_verify_token.side_effect = invalid_token_exc()
 
         # Verify HTTPException is raised
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(
+            HTTPException, match="Invalid authentication token"
+        ) as exc_info:
             await get_current_user("invalid_token")
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
-        assert "Invalid authentication token" in exc_info.value.detail
 
-    @patch("auth_firebase.user_profile_service")
     @patch("auth_firebase.verify_firebase_token")
     async def test_get_current_user_missing_uid(
         self, mock_verify_token, mock_user_service
@@ -115,26 +123,26 @@ class TestGetCurrentUser:
         mock_verify_token.return_value = token_data
 
         # Verify HTTPException is raised for missing UID
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(
+            HTTPException, match="Could not validate credentials"
+        ) as exc_info:
             await get_current_user("token_missing_uid")
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
-        assert "Could not validate credentials" in exc_info.value.detail
 
-    @patch("auth_firebase.user_profile_service")
     @patch("auth_firebase.verify_firebase_token")
     async def test_get_current_user_profile_sync_failure(
         self, mock_verify_token, mock_user_service
     ):
         """Test authentication continues even if profile sync fails."""
         # Setup valid token but failing profile sync
-        token_data = VALID_FIREBASE_TOKEN.to_dict()
+        token_data = _VALID_TOKEN_DATA
         mock_verify_token.return_value = token_data
 
         mock_user_service.sync_user_profile = AsyncMock(
             side_effect=Exception("Firestore error")
         )
-        mock_user_service.is_admin_user = AsyncMock(return_value=False)
+        mock_user_service.is_admin_user = Mock(side_effect=async_return(False))
 
         # Authentication should still succeed using token data
         user = await get_current_user("valid_token")
@@ -145,25 +153,62 @@ class TestGetCurrentUser:
         assert user.full_name == token_data["name"]
 
 
+class TestAuthOverHttp:
+    """Test get_current_user via HTTP requests without the ASGI app."""
+
+    @patch("auth_firebase.verify_firebase_token")
+    async def test_bearer_token_authenticates(
+        self, mock_verify_token, mock_user_service, auth_client
+    ):
+        """Test a valid Bearer token resolves to the authenticated user."""
+        token_data = _VALID_TOKEN_DATA
+        mock_verify_token.return_value = token_data
+        mock_user_service.sync_user_profile = Mock(side_effect=async_return({}))
+        mock_user_service.is_admin_user = Mock(side_effect=async_return(False))
+
+        response = await auth_client.get(
+            "/api/token", headers=create_test_auth_headers("valid_token")
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["uid"] == token_data["uid"]
+        mock_verify_token.assert_called_once_with("valid_token")
+
+    @patch("auth_firebase.verify_firebase_token")
+    async def test_invalid_bearer_token_rejected(self, mock_verify_token, auth_client):
+        """Test an invalid Bearer token is answered with 401."""
+        mock_verify_token.side_effect = invalid_token_exc()
+
+        response = await auth_client.get(
+            "/api/token", headers=create_test_auth_headers("invalid_token")
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
 class TestGetCurrentActiveUser:
     """Test the get_current_active_user dependency function."""
 
     async def test_get_current_active_user_success(self):
         """Test getting active user when user is not disabled."""
-        user = User(uid="test_user_123", email="test@example.com", disabled=False)
+        user = User.model_construct(
+            uid="test_user_123", email="test@example.com", disabled=False
+        )
 
         result = await get_current_active_user(user)
         assert result == user
 
     async def test_get_current_active_user_disabled(self):
         """Test rejection when user is disabled."""
-        user = User(uid="test_user_123", email="test@example.com", disabled=True)
+        user = User.model_construct(
+            uid="test_user_123", email="test@example.com", disabled=True
+        )
 
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(HTTPException, match="Inactive user") as exc_info:
             await get_current_active_user(user)
 
         assert exc_info.value.status_code == 400
-        assert "Inactive user" in exc_info.value.detail
 
 
 class TestGetCurrentAdminUser:
@@ -171,7 +216,7 @@ class TestGetCurrentAdminUser:
 
     async def test_get_current_admin_user_success(self):
         """Test getting admin user when user has admin privileges."""
-        admin_user = User(
+        admin_user = User.model_construct(
             uid="admin_user_456",
             email="admin@potteryapp.test",
             is_admin=True,
@@ -183,22 +228,23 @@ class TestGetCurrentAdminUser:
 
     async def test_get_current_admin_user_not_admin(self):
         """Test rejection when user is not admin."""
-        regular_user = User(
+        regular_user = User.model_construct(
             uid="test_user_123",
             email="test@example.com",
             is_admin=False,
             disabled=False,
         )
 
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(
+            HTTPException, match="Admin privileges required"
+        ) as exc_info:
             await get_current_admin_user(regular_user)
 
         assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-        assert "Admin privileges required" in exc_info.value.detail
 
     async def test_get_current_admin_user_none_admin(self):
         """Test rejection when user admin status is None."""
-        user = User(
+        user = User.model_construct(
             uid="test_user_123", email="test@example.com", is_admin=None, disabled=False
         )
 
@@ -211,35 +257,33 @@ class TestGetCurrentAdminUser:
 class TestCreateAdminUser:
     """Test the create_admin_user utility function."""
 
-    @patch("auth_firebase.user_profile_service")
     async def test_create_admin_user_success(self, mock_user_service):
         """Test successful admin user creation."""
-        mock_user_service.set_admin_status = AsyncMock()
+        mock_user_service.set_admin_status = Mock(side_effect=async_return(None))
 
         admin_user = await create_admin_user("admin@test.com", "admin_uid_123")
 
-        assert admin_user.uid == "admin_uid_123"
-        assert admin_user.email == "admin@test.com"
-        assert admin_user.full_name == "Administrator"
-        assert admin_user.is_admin is True
-        assert admin_user.disabled is False
+        assert admin_user == User(
+            uid="admin_uid_123",
+            email="admin@test.com",
+            full_name="Administrator",
+            disabled=False,
+            is_admin=True,
+        )
 
         mock_user_service.set_admin_status.assert_called_once_with(
             "admin_uid_123", True
         )
 
-    @patch("auth_firebase.user_profile_service")
     async def test_create_admin_user_service_error(self, mock_user_service):
         """Test admin user creation when service fails."""
         mock_user_service.set_admin_status = AsyncMock(
             side_effect=Exception("Service error")
         )
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Service error"):
             await create_admin_user("admin@test.com", "admin_uid_123")
 
-        assert "Service error" in str(exc_info.value)
-
 
 class TestUserModel:
     """Test the User model functionality."""
@@ -277,24 +321,26 @@ class TestUserModel:
 
 
 @pytest.mark.parametrize(
-    "token,exception_type,expected_detail", create_firebase_error_scenarios()
+    "token,exception_type,expected_detail",
+    create_firebase_error_scenarios(),
 )
 class TestFirebaseErrorHandling:
     """Test Firebase authentication error handling scenarios."""
 
     @patch("auth_firebase.verify_firebase_token")
     async def test_firebase_token_errors(
-        self, mock_verify_token, token, exception_type, expected_detail
+        self,
+        mock_verify_token,
+        token,
+        exception_type,
+        expected_detail,
     ):
         """Test various Firebase token verification errors."""
-        # Setup mock to raise specific Firebase exception
-        mock_verify_token.side_effect = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail=expected_detail
-        )
+        # Setup mock to raise the HTTPException for this scenario
+        mock_verify_token.side_effect = unauthorized_exc(expected_detail)
 
         # Verify proper error handling
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(HTTPException, match=re.escape(expected_detail)) as exc_info:
             await get_current_user(token)
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
-        assert expected_detail in exc_info.value.detail
@@ -0,0 +1,109 @@
+"""Unit tests for the GCS service's signed URL handling."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from models import Photo
+from services import gcs_service
+
+GCS_PATH = "items/item-1/photo-1.jpg"
+SIGNED_URL = f"https://signed.example/{GCS_PATH}"
+
+
+@pytest.fixture
+def bucket(mocker, monkeypatch):
+    """Mock GCS bucket behind _ensure_gcs_client, with an empty URL cache."""
+    monkeypatch.setattr(gcs_service, "_signed_url_cache", {})
+    mock_bucket = Mock()
+    mock_bucket.blob.return_value.generate_signed_url.return_value = SIGNED_URL
+    mocker.patch.object(
+        gcs_service, "_ensure_gcs_client", return_value=(None, mock_bucket)
+    )
+    return mock_bucket
+
+
+async def test_generate_signed_url_reuses_cached_url(bucket):
+    """Test repeat requests for a path are served without re-signing."""
+    first = await gcs_service.generate_signed_url(GCS_PATH)
+    second = await gcs_service.generate_signed_url(GCS_PATH)
+
+    assert first == second == SIGNED_URL
+    assert bucket.blob.return_value.generate_signed_url.call_count == 1
+
+
+async def test_generate_signed_url_resigns_after_reuse_window(bucket):
+    """Test a cached URL is replaced once most of its lifetime has passed."""
+    await gcs_service.generate_signed_url(GCS_PATH)
+
+    # Move the entry past its reuse deadline instead of patching the clock,
+    # which the event loop shares
+    url, _ = gcs_service._signed_url_cache[GCS_PATH]
+    gcs_service._signed_url_cache[GCS_PATH] = (url, time.monotonic() - 1)
+    await gcs_service.generate_signed_url(GCS_PATH)
+
+    assert bucket.blob.return_value.generate_signed_url.call_count == 2
+
+
+async def test_generate_signed_url_does_not_cache_failures(bucket):
+    """Test a failed signing attempt is retried on the next request."""
+    signer = bucket.blob.return_value.generate_signed_url
+    signer.side_effect = [Exception("signing failed"), SIGNED_URL]
+
+    assert await gcs_service.generate_signed_url(GCS_PATH) is None
+    assert await gcs_service.generate_signed_url(GCS_PATH) == SIGNED_URL
+
+
+async def test_delete_photo_evicts_cached_url(bucket):
+    """Test deleting a photo drops its cached signed URL."""
+    await gcs_service.generate_signed_url(GCS_PATH)
+
+    await gcs_service.delete_photo_from_gcs(GCS_PATH)
+
+    assert GCS_PATH not in gcs_service._signed_url_cache
+
+
+async def test_generate_signed_urls_batch_signs_shared_paths_once(bucket):
+    """Test a batch signs each distinct path once and keeps per-item order."""
+    shared = Photo(stage="Greenware", gcsPath=GCS_PATH)
+    other = Photo(stage="Bisque", gcsPath="items/item-2/photo-2.jpg")
+
+    responses = await gcs_service.generate_signed_urls_batch(
+        [[shared], [], [other, shared]]
+    )
+
+    assert [[p.id for p in photos] for photos in responses] == [
+        [shared.id],
+        [],
+        [other.id, shared.id],
+    ]
+    assert responses[0][0].signedUrl == SIGNED_URL
+    assert bucket.blob.return_value.generate_signed_url.call_count == 2
+
+
+async def test_generate_signed_url_signs_off_the_event_loop(bucket):
+    """Test the blocking RSA signing runs in the signing executor's threads."""
+    signing_threads = []
+
+    def sign(**kwargs):
+        signing_threads.append(threading.current_thread().name)
+        return SIGNED_URL
+
+    bucket.blob.return_value.generate_signed_url.side_effect = sign
+
+    assert await gcs_service.generate_signed_url(GCS_PATH) == SIGNED_URL
+    assert signing_threads[0].startswith("gcs-sign")
+
+
+async def test_delete_multiple_photos_runs_off_the_event_loop(bucket):
+    """Test the blocking blob deletes run in a worker thread."""
+    deleting_threads = []
+    bucket.blob.return_value.delete.side_effect = lambda: deleting_threads.append(
+        threading.current_thread()
+    )
+
+    assert await gcs_service.delete_multiple_photos_from_gcs([GCS_PATH]) is True
+    assert deleting_threads
+    assert threading.main_thread() not in deleting_threads
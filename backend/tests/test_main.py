@@ -1,6 +1,6 @@
 # tests/test_main.py
+import httpx
 from fastapi import status
-from fastapi.testclient import TestClient
 
 # Import settings carefully, ensuring it's initialized
 try:
@@ -12,9 +12,9 @@ except ImportError:
     )()
 
 
-def test_read_root(client: TestClient):
+async def test_read_root(async_client: httpx.AsyncClient):
     """Test the health check endpoint."""
-    response = client.get("/")
+    response = await async_client.get("/")
     assert response.status_code == status.HTTP_200_OK
     # Use the imported or fallback settings title
     assert response.json() == {"message": f"Welcome to the {settings.api_title}!"}
@@ -7,24 +7,119 @@ This module tests:
 - Firebase admin user creation and verification
 """
 
-from datetime import datetime
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, Mock, call, patch
 
+import httpx
 import pytest
 from fastapi import HTTPException, status
-from fastapi.testclient import TestClient
 
-from auth import User
+from auth import User, get_current_active_user, get_current_user
+from auth_firebase import User as AuthFirebaseUser
 from auth_firebase import create_admin_user, migrate_legacy_admin
+from config import settings
 from core.firebase import create_firebase_user, get_firebase_user_by_email
 from services.user_profile_service import get_user_profile_service
-from tests.utils.firebase_mocks import MockUserRecord, create_test_auth_headers
+from tests.utils.firebase_mocks import (
+    MockEmailAlreadyExistsError,
+    admin_user_record,
+    async_return,
+    create_test_auth_headers,
+)
+
+_AUTH_DENIED = (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+# Stateless test data shared by every test instead of rebuilt per call
+_MIGRATED_ADMIN_TOKEN_DATA = {
+    "uid": "migrated_admin_uid",
+    "email": "admin@potteryapp.test",
+    "name": "Administrator",
+    "email_verified": True,
+}
+_MIGRATED_ADMIN_TOKEN = "migrated_admin_token"
+_MIGRATED_ADMIN_HEADERS = create_test_auth_headers(_MIGRATED_ADMIN_TOKEN)
+
+# Admin user create_admin_user should build for firebase_admin_uid
+_EXPECTED_ADMIN_USER = AuthFirebaseUser(
+    uid="firebase_admin_uid",
+    email="admin@potteryapp.test",
+    full_name="Administrator",
+    disabled=False,
+    is_admin=True,
+)
+
+# Expected mock calls, each asserted as "called exactly once with these args"
+_EXPECTED_ADMIN_SET_CALL = [call("firebase_admin_uid", True)]
+_EXPECTED_UPGRADE_CALL = [call("existing_user_uid", True)]
+_EXPECTED_GET_BY_EMAIL_CALL = [call("admin@potteryapp.test")]
+_EXPECTED_CREATE_USER_CALL = [
+    call(
+        email="admin@potteryapp.test",
+        password="secure_admin_password",
+        display_name="Administrator",
+        email_verified=False,
+    )
+]
+
+
+async def _empty_async_iter():
+    """Async iterator standing in for an empty Firestore query stream."""
+    return
+    yield  # pragma: no cover - makes this an async generator
+
+
+@pytest.fixture
+def firebase_enabled(monkeypatch):
+    """Report Firebase as configured on the real Settings object."""
+    monkeypatch.setattr(type(settings), "firebase_enabled", property(lambda self: True))
+
+
+@pytest.fixture
+def admin_auth_mocks(firebase_enabled):
+    """
+    Authenticate requests as a migrated admin against a mocked Firestore.
+
+    Patches Firebase token verification, the user profile service and the
+    Firestore client once, and yields a namespace with the decoded
+    ``token_data``, the profile ``service`` stub and request ``headers``.
+    Tests set ``service.sync_user_profile`` to the profile they need.
+    """
+    with (
+        patch("services.firestore_service._ensure_firestore_client") as mock_firestore,
+        patch.multiple(
+            "auth",
+            extract_user_info=DEFAULT,
+            verify_firebase_token=DEFAULT,
+            get_user_profile_service=DEFAULT,
+        ) as auth_mocks,
+    ):
+        mock_extract_info = auth_mocks["extract_user_info"]
+        mock_verify_token = auth_mocks["verify_firebase_token"]
+        mock_user_service = auth_mocks["get_user_profile_service"]
+
+        # Mock Firestore to avoid credentials issues
+        mock_collection = Mock()
+        # get_all_items only reads the collection, so the client slot stays empty
+        mock_firestore.return_value = (None, mock_collection)
+        # A factory, so every stream() call gets a fresh (not exhausted) iterator
+        mock_collection.where.return_value.stream.side_effect = _empty_async_iter
+
+        mock_verify_token.return_value = _MIGRATED_ADMIN_TOKEN_DATA
+        mock_extract_info.return_value = _MIGRATED_ADMIN_TOKEN_DATA
+
+        service = SimpleNamespace(is_admin_user=async_return(True))
+        mock_user_service.return_value = service
+
+        yield SimpleNamespace(
+            token_data=_MIGRATED_ADMIN_TOKEN_DATA,
+            service=service,
+            headers=_MIGRATED_ADMIN_HEADERS,
+        )
 
 
 class TestAdminUserMigration:
     """Test admin user migration from legacy to Firebase system."""
 
-    @patch("auth_firebase.user_profile_service")
     async def test_create_admin_user_success(self, mock_user_service):
         """Test successful admin user creation."""
         # Opening move: setup mock user profile service
@@ -36,18 +131,11 @@ class TestAdminUserMigration:
         )
 
         # Victory lap: verify admin user was created correctly
-        assert admin_user.uid == "firebase_admin_uid"
-        assert admin_user.email == "admin@potteryapp.test"
-        assert admin_user.full_name == "Administrator"
-        assert admin_user.is_admin is True
-        assert admin_user.disabled is False
+        assert admin_user == _EXPECTED_ADMIN_USER
 
         # Verify admin status was set in Firestore
-        mock_user_service.set_admin_status.assert_called_once_with(
-            "firebase_admin_uid", True
-        )
+        assert mock_user_service.set_admin_status.mock_calls == _EXPECTED_ADMIN_SET_CALL
 
-    @patch("auth_firebase.user_profile_service")
     async def test_create_admin_user_service_failure(self, mock_user_service):
         """Test admin user creation when Firestore service fails."""
         # Setup service to fail
@@ -71,20 +159,11 @@ class TestAdminUserMigration:
         # Current implementation returns None as placeholder
         assert result is None
 
-    @patch("core.firebase.auth")
-    @patch("core.firebase.initialize_firebase")
-    def test_firebase_admin_user_creation_flow(self, mock_init, mock_auth):
+    def test_firebase_admin_user_creation_flow(self, mock_firebase_sdk):
         """Test complete Firebase admin user creation flow."""
-        # Opening move: setup Firebase initialization and auth mocking
-        mock_init.return_value = Mock()
-
+        # Opening move: setup auth mocking
         # Mock successful user creation directly at auth level
-        admin_user_record = MockUserRecord(
-            uid="new_admin_uid",
-            email="admin@potteryapp.test",
-            display_name="Administrator",
-        )
-        mock_auth.create_user.return_value = admin_user_record
+        mock_firebase_sdk.auth.create_user.return_value = admin_user_record()
 
         # Test user creation
         result = create_firebase_user(
@@ -98,27 +177,16 @@ class TestAdminUserMigration:
         assert result.display_name == "Administrator"
 
         # Verify auth.create_user was called with correct params
-        mock_auth.create_user.assert_called_once_with(
-            email="admin@potteryapp.test",
-            password="secure_admin_password",
-            display_name="Administrator",
-            email_verified=False,
+        assert (
+            mock_firebase_sdk.auth.create_user.mock_calls == _EXPECTED_CREATE_USER_CALL
         )
 
-    @patch("core.firebase.auth")
-    @patch("core.firebase.initialize_firebase")
-    def test_firebase_admin_user_already_exists(self, mock_init, mock_auth):
+    def test_firebase_admin_user_already_exists(self, mock_firebase_sdk):
         """Test handling when Firebase admin user already exists."""
-        # Opening move: setup Firebase initialization
-        mock_init.return_value = Mock()
-
         # Setup: admin user already exists
-        existing_admin = MockUserRecord(
-            uid="existing_admin_uid",
-            email="admin@potteryapp.test",
-            display_name="Administrator",
+        mock_firebase_sdk.auth.get_user_by_email.return_value = admin_user_record(
+            "existing_admin_uid"
         )
-        mock_auth.get_user_by_email.return_value = existing_admin
 
         # Test getting existing user
         result = get_firebase_user_by_email("admin@potteryapp.test")
@@ -127,201 +195,67 @@ class TestAdminUserMigration:
         assert result.email == "admin@potteryapp.test"
 
         # Verify auth.get_user_by_email was called
-        mock_auth.get_user_by_email.assert_called_once_with("admin@potteryapp.test")
+        assert (
+            mock_firebase_sdk.auth.get_user_by_email.mock_calls
+            == _EXPECTED_GET_BY_EMAIL_CALL
+        )
 
 
 class TestAdminDataAccessContinuity:
     """Test that admin user maintains access to existing data after migration."""
 
     @pytest.mark.no_firebase_mock
-    @patch("services.firestore_service._ensure_firestore_client")
-    @patch("auth.settings")
-    @patch("auth.extract_user_info")
-    @patch("auth.verify_firebase_token")
-    @patch("auth.get_user_profile_service")
-    def test_migrated_admin_accesses_existing_items(
+    @pytest.mark.parametrize(
+        "profile",
+        [
+            {
+                "uid": "migrated_admin_uid",
+                "email": "admin@potteryapp.test",
+                "displayName": "Administrator",
+                "isAdmin": True,
+                "migratedFromLegacy": True,  # Flag to indicate migration
+            },
+            {
+                "uid": "migrated_admin_uid",
+                "email": "admin@potteryapp.test",
+                "isAdmin": True,
+                "legacyUserId": "admin",  # Reference to legacy user ID
+            },
+            {"uid": "migrated_admin_uid", "isAdmin": True},
+        ],
+        ids=["existing_items", "item_ownership", "admin_privileges"],
+    )
+    async def test_migrated_admin_keeps_item_access(
         self,
-        mock_user_service,
-        mock_verify_token,
-        mock_extract_info,
-        mock_settings,
-        mock_firestore,
-        client: TestClient,
+        admin_auth_mocks,
+        async_client: httpx.AsyncClient,
+        profile,
     ):
-        """Test that migrated admin can access existing pottery items."""
-        # Opening move: enable Firebase and mock Firestore
-        mock_settings.firebase_enabled = True
-
-        # Mock Firestore to avoid credentials issues
-        mock_db = Mock()
-        mock_collection = Mock()
-        mock_firestore.return_value = (mock_db, mock_collection)
-
-        # Mock empty items collection for this test - proper async iterator
-        async def mock_async_iterator():
-            for item in []:
-                yield item
-
-        mock_collection.where.return_value.stream.return_value = mock_async_iterator()
-
-        # Setup admin Firebase token
-        admin_token_data = {
-            "uid": "migrated_admin_uid",
-            "email": "admin@potteryapp.test",
-            "name": "Administrator",
-            "email_verified": True,
-        }
-        mock_verify_token.return_value = admin_token_data
-
-        # Mock extracted user info
-        mock_extract_info.return_value = admin_token_data
-
-        # Mock admin profile with existing data flag
-        admin_profile = {
-            "uid": "migrated_admin_uid",
-            "email": "admin@potteryapp.test",
-            "displayName": "Administrator",
-            "isAdmin": True,
-            "migratedFromLegacy": True,  # Flag to indicate migration
-        }
-
-        mock_service = mock_user_service.return_value
-        mock_service.sync_user_profile = AsyncMock(return_value=admin_profile)
-        mock_service.is_admin_user = AsyncMock(return_value=True)
+        """Test that a migrated admin can still access pottery items as an admin."""
+        # Opening move: sync the scenario's migrated admin profile
+        admin_auth_mocks.service.sync_user_profile = async_return(profile)
 
-        # Test admin access to items endpoint
-        headers = create_test_auth_headers("migrated_admin_firebase_token")
-        response = client.get("/api/items", headers=headers)
+        # Main play: admin access to the items endpoint
+        response = await async_client.get(
+            "/api/items", headers=admin_auth_mocks.headers
+        )
 
         # Should have access (not 401 or 403) - this proves Firebase auth is working
-        assert response.status_code not in [
-            status.HTTP_401_UNAUTHORIZED,
-            status.HTTP_403_FORBIDDEN,
-        ]
-
-        # Victory lap: Firebase authentication chain is working correctly
-        # (The specific admin check call varies by endpoint - key is auth succeeds)
-
-    @patch("auth.settings")
-    @patch("auth.verify_firebase_token")
-    @patch("auth.get_user_profile_service")
-    def test_migrated_admin_maintains_item_ownership(
-        self, mock_user_service, mock_verify_token, mock_settings, client: TestClient
-    ):
-        """Test that migrated admin maintains ownership of existing items."""
-        # Opening move: enable Firebase for this test
-        mock_settings.firebase_enabled = True
+        assert response.status_code not in _AUTH_DENIED
 
-        # This test would verify that items created with the legacy admin user
-        # are still accessible by the migrated Firebase admin user
-
-        admin_token_data = {
-            "uid": "migrated_admin_uid",
-            "email": "admin@potteryapp.test",
-            "name": "Administrator",
-            "email_verified": True,
-        }
-        mock_verify_token.return_value = admin_token_data
-
-        # Mock admin profile
-        admin_profile = {
-            "uid": "migrated_admin_uid",
-            "email": "admin@potteryapp.test",
-            "isAdmin": True,
-            "legacyUserId": "admin",  # Reference to legacy user ID
-        }
-
-        mock_service = mock_user_service.return_value
-        mock_service.sync_user_profile = AsyncMock(return_value=admin_profile)
-        mock_service.is_admin_user = AsyncMock(return_value=True)
-
-        headers = create_test_auth_headers("migrated_admin_token")
-
-        # Test that admin can still access and modify items
-        # Note: Actual item access would depend on having test data
-        response = client.get("/api/items", headers=headers)
-        assert response.status_code != status.HTTP_401_UNAUTHORIZED
-
-        # Test item creation still works
-        item_data = {
-            "title": "Test Pottery Item",
-            "description": "Created by migrated admin",
-            "stage": "bisque",
-        }
-        response = client.post("/api/items", json=item_data, headers=headers)
-        # Should work (may fail for other reasons like validation, but not auth)
-        assert response.status_code != status.HTTP_401_UNAUTHORIZED
-
-    @pytest.mark.no_firebase_mock
-    @patch("services.firestore_service._ensure_firestore_client")
-    @patch("auth.settings")
-    @patch("auth.extract_user_info")
-    @patch("auth.verify_firebase_token")
-    @patch("auth.get_user_profile_service")
-    def test_admin_privilege_verification_after_migration(
-        self,
-        mock_user_service,
-        mock_verify_token,
-        mock_extract_info,
-        mock_settings,
-        mock_firestore,
-        client: TestClient,
-    ):
-        """Test that admin privileges are properly verified after migration."""
-        # Opening move: enable Firebase and mock Firestore
-        mock_settings.firebase_enabled = True
-
-        # Mock Firestore to avoid credentials issues
-        mock_db = Mock()
-        mock_collection = Mock()
-        mock_firestore.return_value = (mock_db, mock_collection)
-
-        # Mock empty items collection for this test - proper async iterator
-        async def mock_async_iterator():
-            for item in []:
-                yield item
-
-        mock_collection.where.return_value.stream.return_value = mock_async_iterator()
-
-        # Setup admin token
-        admin_token_data = {
-            "uid": "migrated_admin_uid",
-            "email": "admin@potteryapp.test",
-            "name": "Administrator",
-            "email_verified": True,
-        }
-        mock_verify_token.return_value = admin_token_data
-
-        # Mock extracted user info
-        mock_extract_info.return_value = admin_token_data
-
-        # Mock admin profile
-        mock_service = mock_user_service.return_value
-        mock_service.sync_user_profile = AsyncMock(
-            return_value={
-                "uid": "migrated_admin_uid",
-                "isAdmin": True,
-            }
+        # Victory lap: item writes depend on the same user, so resolve it directly
+        # instead of sending a full create request through the app
+        user = await get_current_active_user(
+            await get_current_user(_MIGRATED_ADMIN_TOKEN)
         )
-        mock_service.is_admin_user = AsyncMock(return_value=True)
-
-        headers = create_test_auth_headers("admin_token")
-
-        # Make a request that triggers admin check
-        response = client.get("/api/items", headers=headers)
-
-        # Should not be denied due to lack of admin privileges
-        assert response.status_code != status.HTTP_403_FORBIDDEN
-
-        # Victory lap: Firebase authentication working for admin user
-        # (Admin privilege verification depends on specific endpoint implementation)
+        assert user.uid == "migrated_admin_uid"
+        assert user.is_admin is True
 
 
 class TestMigrationScenarios:
     """Test various migration scenarios and edge cases."""
 
-    @patch("services.user_profile_service.UserProfileService")
-    async def test_migration_with_existing_firestore_profile(self, mock_service_class):
+    async def test_migration_with_existing_firestore_profile(self, monkeypatch):
         """Test migration when user already has Firestore profile."""
         # Setup existing profile that needs admin upgrade
         existing_profile = {
@@ -331,9 +265,15 @@ class TestMigrationScenarios:
             "isAdmin": False,
         }
 
-        mock_service = mock_service_class.return_value
-        mock_service.get_user_profile = AsyncMock(return_value=existing_profile)
-        mock_service.set_admin_status = AsyncMock()
+        mock_service = SimpleNamespace(
+            get_user_profile=async_return(existing_profile),
+            set_admin_status=AsyncMock(),
+        )
+        # Install it as the module singleton so get_user_profile_service()
+        # hands it back without building a UserProfileService
+        monkeypatch.setattr(
+            "services.user_profile_service._user_profile_service", mock_service
+        )
 
         service = get_user_profile_service()
 
@@ -341,43 +281,25 @@ class TestMigrationScenarios:
         await service.set_admin_status("existing_user_uid", True)
 
         # Verify admin status was set
-        mock_service.set_admin_status.assert_called_once_with("existing_user_uid", True)
-
-    async def test_migration_error_scenarios(self):
-        """Test migration error handling scenarios."""
-        # Test case 1: Firebase user creation fails
-        with patch("core.firebase.auth") as mock_auth:
-            with patch("core.firebase.initialize_firebase") as mock_init:
-                # Setup Firebase mocking
-                mock_init.return_value = Mock()
-
-                # Create proper exception classes
-                class MockEmailAlreadyExistsError(Exception):
-                    pass
-
-                mock_auth.EmailAlreadyExistsError = MockEmailAlreadyExistsError
-                mock_auth.create_user.side_effect = MockEmailAlreadyExistsError(
-                    "User with this email already exists"
-                )
-
-                with pytest.raises(HTTPException) as exc_info:
-                    create_firebase_user(
-                        email="admin@potteryapp.test", password="password"
-                    )
-
-                assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
-                assert "User with this email already exists" in exc_info.value.detail
-
-    @patch("auth.settings")
-    @patch("auth.verify_firebase_token")
-    @patch("auth.get_user_profile_service")
-    def test_legacy_compatibility_properties(
-        self, mock_user_service, mock_verify_token, mock_settings
-    ):
-        """Test that User model maintains compatibility with legacy code."""
-        # Opening move: enable Firebase for this test
-        mock_settings.firebase_enabled = True
+        assert mock_service.set_admin_status.mock_calls == _EXPECTED_UPGRADE_CALL
+
+    def test_migration_error_scenarios(self, mock_firebase_sdk):
+        """Test migration error handling when Firebase user creation fails."""
+        mock_auth = mock_firebase_sdk.auth
+        mock_auth.EmailAlreadyExistsError = MockEmailAlreadyExistsError
+        mock_auth.create_user.side_effect = MockEmailAlreadyExistsError(
+            "User with this email already exists"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            create_firebase_user(email="admin@potteryapp.test", password="password")
 
+        exc = exc_info.value
+        assert exc.status_code == status.HTTP_400_BAD_REQUEST
+        assert "User with this email already exists" in exc.detail
+
+    def test_legacy_compatibility_properties(self):
+        """Test that User model maintains compatibility with legacy code."""
         # Setup Firebase token data
         token_data = {
             "uid": "firebase_user_uid",
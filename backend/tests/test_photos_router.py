@@ -1,4 +1,5 @@
 # tests/test_photos_router.py
+import functools
 import io  # For creating dummy file content
 import os
 
@@ -7,30 +8,38 @@ import os
 import sys
 import uuid
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import ANY, AsyncMock
 
+import httpx
 import pytest
 
 # *** UPDATED: Import HTTPException ***
 from fastapi import status
-from fastapi.testclient import TestClient
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from models import Photo, PhotoUpdate, PotteryItem  # noqa: E402
+from services import firestore_service, gcs_service  # noqa: E402
+
+# Routes authenticate through override_auth, so the token-verification
+# patches from conftest's mock_firebase_auth are never exercised here
+pytestmark = pytest.mark.no_firebase_mock
 
 # Re-use sample data from items test or define new ones
 TEST_ITEM_ID_1 = str(uuid.uuid4())
 TEST_PHOTO_ID_NEW = str(uuid.uuid4())  # For new upload
 EXISTING_PHOTO_ID = str(uuid.uuid4())
 EXISTING_GCS_PATH = f"items/{TEST_ITEM_ID_1}/{EXISTING_PHOTO_ID}.png"
+UPLOADED_GCS_PATH = f"items/{TEST_ITEM_ID_1}/{TEST_PHOTO_ID_NEW}.jpg"
 
 NOW_UTC = datetime.now(timezone.utc)
 
+# Sample data is known-good, so it is built with model_construct (no validation)
 # Sample Photo object (internal representation)
-existing_photo_internal = Photo(
+existing_photo_internal = Photo.model_construct(
     id=EXISTING_PHOTO_ID,
     gcsPath=EXISTING_GCS_PATH,
     stage="Greenware",
@@ -39,8 +48,17 @@ existing_photo_internal = Photo(
     isPrimary=False,  # Not primary by default
 )
 
+# A photo that belongs to the item but is not the one being deleted
+other_photo_internal = Photo.model_construct(
+    id="other_photo",
+    gcsPath="other/path",
+    stage="Glazed",
+    uploadedAt=NOW_UTC,
+    uploadedTimezone="UTC",
+)
+
 # Sample PotteryItem with an existing photo
-sample_item_with_photo = PotteryItem(
+sample_item_with_photo = PotteryItem.model_construct(
     id=TEST_ITEM_ID_1,
     name="Item With Photo",
     clayType="Stoneware",
@@ -52,7 +70,7 @@ sample_item_with_photo = PotteryItem(
 )
 
 # Sample item with no photos (for upload test)
-sample_item_no_photos = PotteryItem(
+sample_item_no_photos = PotteryItem.model_construct(
     id=TEST_ITEM_ID_1,
     name="Item No Photo",
     clayType="Stoneware",
@@ -63,31 +81,85 @@ sample_item_no_photos = PotteryItem(
     user_id="test-firebase-uid-123",
 )
 
+# Form parts for upload tests that don't care about the file content
+UPLOAD_FORM = {"photo_stage": "Greenware"}
+UPLOAD_FILES = {"file": ("dummy.jpg", b"data", "image/jpeg")}
+
+# The full multipart request, encoded once and posted as raw content
+_upload_request = httpx.Request(
+    "POST", "http://test", data=UPLOAD_FORM, files=UPLOAD_FILES
+)
+UPLOAD_REQUEST_KWARGS = {
+    "content": _upload_request.read(),
+    "headers": {"Content-Type": _upload_request.headers["Content-Type"]},
+}
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns NOW_UTC."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return NOW_UTC
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze the clock Photo uses for its uploadedAt default."""
+    monkeypatch.setattr("models.datetime", _FrozenDatetime)
+    return NOW_UTC
+
+
+@pytest.fixture
+def photo_service_mocks(mocker):
+    """
+    Patch every Firestore and GCS service call the photos router makes.
+
+    Patches are installed once per test and returned as a namespace of
+    AsyncMocks, so tests only configure return values and side effects.
+    """
+    patch_fs = functools.partial(
+        mocker.patch.object, firestore_service, new_callable=AsyncMock
+    )
+    patch_gcs = functools.partial(
+        mocker.patch.object, gcs_service, new_callable=AsyncMock
+    )
+    return SimpleNamespace(
+        get_item=patch_fs("get_item_by_id"),
+        add_photo=patch_fs("add_photo_to_item"),
+        remove_photo=patch_fs("remove_photo_from_item"),
+        update_details=patch_fs("update_photo_details_in_item"),
+        gcs_upload=patch_gcs("upload_photo_to_gcs"),
+        gcs_delete=patch_gcs("delete_photo_from_gcs"),
+        gen_url=patch_gcs("generate_signed_url"),
+    )
+
 
 # --- POST /api/items/{item_id}/photos ---
 
 
-@pytest.mark.asyncio
-async def test_upload_photo_success(client: TestClient, mocker, auth_headers):
+async def test_upload_photo_success(
+    async_client: httpx.AsyncClient,
+    photo_service_mocks,
+    mocker,
+    override_auth,
+    frozen_now,
+):
     """Test POST /api/items/{item_id}/photos successfully."""
     # 1. Mock underlying service call used by the dependency
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_no_photos  # Item exists
 
     # 2. Mock GCS upload
-    mock_gcs_upload = mocker.patch(
-        "services.gcs_service.upload_photo_to_gcs", new_callable=AsyncMock
-    )
+    mock_gcs_upload = photo_service_mocks.gcs_upload
     expected_gcs_path = f"items/{TEST_ITEM_ID_1}/{TEST_PHOTO_ID_NEW}.jpg"
-    mock_uuid = mocker.patch("uuid.uuid4", return_value=uuid.UUID(TEST_PHOTO_ID_NEW))
+    mock_uuid = mocker.patch.object(
+        uuid, "uuid4", return_value=uuid.UUID(TEST_PHOTO_ID_NEW)
+    )
     mock_gcs_upload.return_value = expected_gcs_path
 
     # 3. Mock Firestore add photo metadata
-    mock_fs_add_photo = mocker.patch(
-        "services.firestore_service.add_photo_to_item", new_callable=AsyncMock
-    )
+    mock_fs_add_photo = photo_service_mocks.add_photo
     # Simulate the service returning the updated item with the new photo
     new_photo_internal = Photo(
         id=TEST_PHOTO_ID_NEW,
@@ -98,14 +170,13 @@ async def test_upload_photo_success(client: TestClient, mocker, auth_headers):
         uploadedAt=NOW_UTC,  # Should match mocked datetime.now
         isPrimary=True,  # First photo should be primary
     )
-    updated_item_internal = sample_item_no_photos.model_copy(deep=True)
-    updated_item_internal.photos.append(new_photo_internal)
+    updated_item_internal = sample_item_no_photos.model_copy(
+        update={"photos": [new_photo_internal]}
+    )
     mock_fs_add_photo.return_value = updated_item_internal
 
     # 4. Mock GCS generate signed URL for the response
-    mock_generate_url = mocker.patch(
-        "services.gcs_service.generate_signed_url", new_callable=AsyncMock
-    )
+    mock_generate_url = photo_service_mocks.gen_url
     mock_generate_url.return_value = (
         f"https://fake-signed-url.com/{TEST_PHOTO_ID_NEW}.jpg"
     )
@@ -116,15 +187,10 @@ async def test_upload_photo_success(client: TestClient, mocker, auth_headers):
     form_data = {"photo_stage": "Greenware", "photo_note": "Test upload"}
     files = {"file": ("dummy.jpg", dummy_file, "image/jpeg")}
 
-    # Patch datetime.now to control uploadedAt timestamp consistency in test
-    mock_dt = mocker.patch("datetime.datetime", wraps=datetime)
-    mock_dt.now.return_value = NOW_UTC  # Control what now(timezone.utc) returns
-
-    response = client.post(
+    response = await async_client.post(
         f"/api/items/{TEST_ITEM_ID_1}/photos",
         data=form_data,
         files=files,
-        headers=auth_headers,
     )
 
     # Assertions
@@ -157,6 +223,7 @@ async def test_upload_photo_success(client: TestClient, mocker, auth_headers):
     added_photo_arg = call_args[1]
     assert isinstance(added_photo_arg, Photo)
     assert added_photo_arg.id == TEST_PHOTO_ID_NEW
+    assert added_photo_arg.uploadedAt == NOW_UTC  # From the frozen clock
     assert (
         call_kwargs["user_id"] == "test-firebase-uid-123"
     )  # Check user_id is passed correctly
@@ -165,24 +232,16 @@ async def test_upload_photo_success(client: TestClient, mocker, auth_headers):
     mock_uuid.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_upload_photo_item_not_found(client: TestClient, mocker, auth_headers):
+async def test_upload_photo_item_not_found(
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth
+):
     """Test POST /photos when the item doesn't exist."""
     # *** FIX: Mock the underlying service call to return None ***
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = None  # Simulate item not found in DB
 
-    dummy_file = io.BytesIO(b"data")
-    files = {"file": ("dummy.jpg", dummy_file, "image/jpeg")}
-    form_data = {"photo_stage": "Greenware"}
-
-    response = client.post(
-        f"/api/items/{TEST_ITEM_ID_1}/photos",
-        data=form_data,
-        files=files,
-        headers=auth_headers,
+    response = await async_client.post(
+        f"/api/items/{TEST_ITEM_ID_1}/photos", **UPLOAD_REQUEST_KWARGS
     )
 
     # Assert: The _get_item_or_404 dependency should now run, get None, and raise 404
@@ -196,145 +255,104 @@ async def test_upload_photo_item_not_found(client: TestClient, mocker, auth_head
     )
 
 
-@pytest.mark.asyncio
-async def test_upload_photo_validation_error_missing_file(
-    client: TestClient, mocker, auth_headers
-):
-    """Test POST /photos with missing file."""
-    # Mock dependency service call to allow request to reach validation stage
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
-    mock_get_item_svc.return_value = sample_item_no_photos
-
-    form_data = {"photo_stage": "Greenware"}
-    response = client.post(
-        f"/api/items/{TEST_ITEM_ID_1}/photos", data=form_data, headers=auth_headers
-    )  # No files
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-
-@pytest.mark.asyncio
-async def test_upload_photo_validation_error_missing_stage(
-    client: TestClient, mocker, auth_headers
+@pytest.mark.parametrize(
+    "request_kwargs,mock_setup,expected_status,expected_detail,awaited",
+    [
+        # Missing file: FastAPI rejects the form before the endpoint runs
+        (
+            {"data": UPLOAD_FORM},
+            {},
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            None,
+            {},
+        ),
+        # Missing stage
+        (
+            {"files": UPLOAD_FILES},
+            {},
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            None,
+            {},
+        ),
+        # GCS upload fails
+        (
+            UPLOAD_REQUEST_KWARGS,
+            {"gcs_upload": {"side_effect": Exception("GCS bucket permission denied")}},
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Failed to upload photo to storage.",
+            {"gcs_upload": None},
+        ),
+        # Firestore metadata update fails, so the uploaded blob is cleaned up
+        (
+            UPLOAD_REQUEST_KWARGS,
+            {
+                "gcs_upload": {"return_value": UPLOADED_GCS_PATH},
+                "add_photo": {
+                    "side_effect": Exception("Firestore array update failed")
+                },
+                "gcs_delete": {"return_value": True},
+            },
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Failed to update item with photo metadata.",
+            {"add_photo": None, "gcs_delete": (UPLOADED_GCS_PATH,)},
+        ),
+    ],
+    ids=["missing_file", "missing_stage", "gcs_error", "firestore_error"],
+)
+async def test_upload_photo_errors(
+    async_client: httpx.AsyncClient,
+    photo_service_mocks,
+    mocker,
+    override_auth,
+    frozen_now,
+    request_kwargs,
+    mock_setup,
+    expected_status,
+    expected_detail,
+    awaited,
 ):
-    """Test POST /photos with missing stage."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
-    mock_get_item_svc.return_value = sample_item_no_photos
-
-    dummy_file = io.BytesIO(b"data")
-    files = {"file": ("dummy.jpg", dummy_file, "image/jpeg")}
-    response = client.post(
-        f"/api/items/{TEST_ITEM_ID_1}/photos", files=files, headers=auth_headers
-    )  # No data
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-
-@pytest.mark.asyncio
-async def test_upload_photo_gcs_error(client: TestClient, mocker, auth_headers):
-    """Test POST /photos when GCS upload fails."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
-    mock_get_item_svc.return_value = sample_item_no_photos
+    """Test POST /photos validation errors and storage/Firestore failures."""
+    # Item exists, so requests get past the _get_item_or_404 dependency
+    photo_service_mocks.get_item.return_value = sample_item_no_photos
+    for name, attrs in mock_setup.items():
+        getattr(photo_service_mocks, name).configure_mock(**attrs)
+    mocker.patch.object(uuid, "uuid4", return_value=uuid.UUID(TEST_PHOTO_ID_NEW))
 
-    mock_gcs_upload = mocker.patch(
-        "services.gcs_service.upload_photo_to_gcs", new_callable=AsyncMock
+    response = await async_client.post(
+        f"/api/items/{TEST_ITEM_ID_1}/photos", **request_kwargs
     )
-    mock_gcs_upload.side_effect = Exception("GCS bucket permission denied")
 
-    _ = mocker.patch("uuid.uuid4", return_value=uuid.UUID(TEST_PHOTO_ID_NEW))
-
-    dummy_file = io.BytesIO(b"data")
-    files = {"file": ("dummy.jpg", dummy_file, "image/jpeg")}
-    form_data = {"photo_stage": "Greenware"}
-
-    response = client.post(
-        f"/api/items/{TEST_ITEM_ID_1}/photos",
-        data=form_data,
-        files=files,
-        headers=auth_headers,
-    )
-
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    # Check detail from the specific handler in upload_photo endpoint
-    assert response.json()["detail"] == "Failed to upload photo to storage."
-    mock_gcs_upload.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_upload_photo_firestore_error(client: TestClient, mocker, auth_headers):
-    """Test POST /photos when adding metadata to Firestore fails."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
-    mock_get_item_svc.return_value = sample_item_no_photos
-
-    mock_gcs_upload = mocker.patch(
-        "services.gcs_service.upload_photo_to_gcs", new_callable=AsyncMock
-    )
-    expected_gcs_path = f"items/{TEST_ITEM_ID_1}/{TEST_PHOTO_ID_NEW}.jpg"
-    mock_gcs_upload.return_value = expected_gcs_path
-
-    mock_fs_add_photo = mocker.patch(
-        "services.firestore_service.add_photo_to_item", new_callable=AsyncMock
-    )
-    mock_fs_add_photo.side_effect = Exception("Firestore array update failed")
-
-    mock_gcs_delete = mocker.patch(
-        "services.gcs_service.delete_photo_from_gcs", new_callable=AsyncMock
-    )
-    mock_gcs_delete.return_value = True
-
-    _ = mocker.patch("uuid.uuid4", return_value=uuid.UUID(TEST_PHOTO_ID_NEW))
-    mock_dt = mocker.patch("datetime.datetime", wraps=datetime)
-    mock_dt.now.return_value = NOW_UTC
-
-    dummy_file = io.BytesIO(b"data")
-    files = {"file": ("dummy.jpg", dummy_file, "image/jpeg")}
-    form_data = {"photo_stage": "Greenware"}
-
-    response = client.post(
-        f"/api/items/{TEST_ITEM_ID_1}/photos",
-        data=form_data,
-        files=files,
-        headers=auth_headers,
-    )
-
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    # Check detail from the specific handler in upload_photo endpoint
-    assert response.json()["detail"] == "Failed to update item with photo metadata."
-    mock_fs_add_photo.assert_awaited_once()
-    mock_gcs_delete.assert_awaited_once_with(expected_gcs_path)
+    assert response.status_code == expected_status
+    if expected_detail is not None:
+        # Detail from the specific handler in upload_photo endpoint
+        assert response.json()["detail"] == expected_detail
+    for name, args in awaited.items():
+        mock = getattr(photo_service_mocks, name)
+        if args is None:
+            mock.assert_awaited_once()
+        else:
+            mock.assert_awaited_once_with(*args)
 
 
 # --- DELETE /api/items/{item_id}/photos/{photo_id} ---
 
 
-@pytest.mark.asyncio
-async def test_delete_photo_success(client: TestClient, mocker, auth_headers):
+async def test_delete_photo_success(
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth
+):
     """Test DELETE /photos/{photo_id} successfully."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_with_photo  # Item exists with photo
 
-    mock_gcs_delete = mocker.patch(
-        "services.gcs_service.delete_photo_from_gcs", new_callable=AsyncMock
-    )
+    mock_gcs_delete = photo_service_mocks.gcs_delete
     mock_gcs_delete.return_value = True
 
-    mock_fs_remove_photo = mocker.patch(
-        "services.firestore_service.remove_photo_from_item", new_callable=AsyncMock
-    )
-    updated_item_internal = sample_item_with_photo.model_copy(deep=True)
-    updated_item_internal.photos = []
+    mock_fs_remove_photo = photo_service_mocks.remove_photo
+    updated_item_internal = sample_item_with_photo.model_copy(update={"photos": []})
     mock_fs_remove_photo.return_value = updated_item_internal
 
-    response = client.delete(
-        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}", headers=auth_headers
+    response = await async_client.delete(
+        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}"
     )
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -347,17 +365,16 @@ async def test_delete_photo_success(client: TestClient, mocker, auth_headers):
     )
 
 
-@pytest.mark.asyncio
-async def test_delete_photo_item_not_found(client: TestClient, mocker, auth_headers):
+async def test_delete_photo_item_not_found(
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth
+):
     """Test DELETE /photos/{photo_id} when item not found."""
     # *** FIX: Mock the underlying service call to return None ***
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = None  # Simulate item not found in DB
 
-    response = client.delete(
-        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}", headers=auth_headers
+    response = await async_client.delete(
+        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}"
     )
 
     # Assert: The _get_item_or_404 dependency should now run, get None, and raise 404
@@ -371,37 +388,23 @@ async def test_delete_photo_item_not_found(client: TestClient, mocker, auth_head
     )
 
 
-@pytest.mark.asyncio
 async def test_delete_photo_photo_not_found_in_item(
-    client: TestClient, mocker, auth_headers
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth
 ):
     """Test DELETE /photos/{photo_id} when item exists but photo doesn't."""
     # Simulate item returned by dependency service call, but photo isn't in it
-    item_without_target_photo = sample_item_with_photo.model_copy(deep=True)
-    item_without_target_photo.photos = [
-        Photo(
-            id="other_photo",
-            gcsPath="other/path",
-            stage="Glazed",
-            uploadedAt=NOW_UTC,
-            uploadedTimezone="UTC",
-        )
-    ]
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
+    item_without_target_photo = sample_item_with_photo.model_copy(
+        update={"photos": [other_photo_internal]}
     )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = item_without_target_photo
 
     # Mock services that shouldn't be called if photo isn't found by router helper
-    mock_gcs_delete = mocker.patch(
-        "services.gcs_service.delete_photo_from_gcs", new_callable=AsyncMock
-    )
-    mock_fs_remove_photo = mocker.patch(
-        "services.firestore_service.remove_photo_from_item", new_callable=AsyncMock
-    )
+    mock_gcs_delete = photo_service_mocks.gcs_delete
+    mock_fs_remove_photo = photo_service_mocks.remove_photo
 
-    response = client.delete(
-        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}", headers=auth_headers
+    response = await async_client.delete(
+        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}"
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -417,26 +420,21 @@ async def test_delete_photo_photo_not_found_in_item(
     mock_fs_remove_photo.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_delete_photo_gcs_error(client: TestClient, mocker, auth_headers):
+async def test_delete_photo_gcs_error(
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth
+):
     """Test DELETE /photos/{photo_id} when GCS delete fails."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_with_photo
 
-    mock_gcs_delete = mocker.patch(
-        "services.gcs_service.delete_photo_from_gcs", new_callable=AsyncMock
-    )
+    mock_gcs_delete = photo_service_mocks.gcs_delete
     # Simulate GCS failure by raising an exception
     mock_gcs_delete.side_effect = Exception("GCS Network Error")
 
-    mock_fs_remove_photo = mocker.patch(
-        "services.firestore_service.remove_photo_from_item", new_callable=AsyncMock
-    )
+    mock_fs_remove_photo = photo_service_mocks.remove_photo
 
-    response = client.delete(
-        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}", headers=auth_headers
+    response = await async_client.delete(
+        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}"
     )
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -449,26 +447,21 @@ async def test_delete_photo_gcs_error(client: TestClient, mocker, auth_headers):
     mock_fs_remove_photo.assert_not_awaited()  # Should not be called if GCS fails
 
 
-@pytest.mark.asyncio
-async def test_delete_photo_firestore_error(client: TestClient, mocker, auth_headers):
+async def test_delete_photo_firestore_error(
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth
+):
     """Test DELETE /photos/{photo_id} when Firestore remove fails."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_with_photo
 
-    mock_gcs_delete = mocker.patch(
-        "services.gcs_service.delete_photo_from_gcs", new_callable=AsyncMock
-    )
+    mock_gcs_delete = photo_service_mocks.gcs_delete
     mock_gcs_delete.return_value = True
 
-    mock_fs_remove_photo = mocker.patch(
-        "services.firestore_service.remove_photo_from_item", new_callable=AsyncMock
-    )
+    mock_fs_remove_photo = photo_service_mocks.remove_photo
     mock_fs_remove_photo.side_effect = Exception("Firestore array remove failed")
 
-    response = client.delete(
-        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}", headers=auth_headers
+    response = await async_client.delete(
+        f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}"
     )
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -487,37 +480,28 @@ async def test_delete_photo_firestore_error(client: TestClient, mocker, auth_hea
 photo_update_payload = {"stage": "Glazed", "imageNote": "Final photo"}
 
 
-@pytest.mark.asyncio
 async def test_update_photo_details_success(
-    client: TestClient, mocker, auth_headers, common_headers
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth, common_headers
 ):
     """Test PUT /photos/{photo_id} successfully."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_with_photo  # Item exists with photo
 
-    mock_update_details = mocker.patch(
-        "services.firestore_service.update_photo_details_in_item",
-        new_callable=AsyncMock,
-    )
+    mock_update_details = photo_service_mocks.update_details
     updated_photo_internal = existing_photo_internal.model_copy(
         update=photo_update_payload
     )
     mock_update_details.return_value = updated_photo_internal
 
-    mock_generate_url = mocker.patch(
-        "services.gcs_service.generate_signed_url", new_callable=AsyncMock
-    )
+    mock_generate_url = photo_service_mocks.gen_url
     mock_generate_url.return_value = (
         f"https://fake-signed-url.com/{EXISTING_PHOTO_ID}.png"
     )
 
-    headers = {**common_headers, **auth_headers}
-    response = client.put(
+    response = await async_client.put(
         f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}",
         json=photo_update_payload,
-        headers=headers,
+        headers=common_headers,
     )
 
     assert response.status_code == status.HTTP_200_OK
@@ -542,22 +526,18 @@ async def test_update_photo_details_success(
     mock_generate_url.assert_awaited_once_with(EXISTING_GCS_PATH)
 
 
-@pytest.mark.asyncio
 async def test_update_photo_details_item_not_found(
-    client: TestClient, mocker, auth_headers, common_headers
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth, common_headers
 ):
     """Test PUT /photos/{photo_id} when item not found."""
     # *** FIX: Mock the underlying service call to return None ***
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = None  # Simulate item not found in DB
 
-    headers = {**common_headers, **auth_headers}
-    response = client.put(
+    response = await async_client.put(
         f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}",
         json=photo_update_payload,
-        headers=headers,
+        headers=common_headers,
     )
 
     # Assert: The _get_item_or_404 dependency should now run, get None, and raise 404
@@ -571,29 +551,22 @@ async def test_update_photo_details_item_not_found(
     )
 
 
-@pytest.mark.asyncio
 async def test_update_photo_details_photo_not_found(
-    client: TestClient, mocker, auth_headers, common_headers
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth, common_headers
 ):
     """Test PUT /photos/{photo_id} when photo not found in item."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_with_photo  # Item exists
 
-    mock_update_details = mocker.patch(
-        "services.firestore_service.update_photo_details_in_item",
-        new_callable=AsyncMock,
-    )
+    mock_update_details = photo_service_mocks.update_details
     mock_update_details.return_value = (
         None  # Simulate service returning None for photo not found
     )
 
-    headers = {**common_headers, **auth_headers}
-    response = client.put(
+    response = await async_client.put(
         f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}",
         json=photo_update_payload,
-        headers=headers,
+        headers=common_headers,
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -610,23 +583,19 @@ async def test_update_photo_details_photo_not_found(
     )
 
 
-@pytest.mark.asyncio
 async def test_update_photo_details_validation_error(
-    client: TestClient, mocker, auth_headers, common_headers
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth, common_headers
 ):
     """Test PUT /photos/{photo_id} with invalid payload type."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_with_photo
 
     invalid_payload = {"stage": 123}  # Stage should be string
 
-    headers = {**common_headers, **auth_headers}
-    response = client.put(
+    response = await async_client.put(
         f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}",
         json=invalid_payload,
-        headers=headers,
+        headers=common_headers,
     )
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -634,27 +603,20 @@ async def test_update_photo_details_validation_error(
     # get_item_by_id is never awaited
 
 
-@pytest.mark.asyncio
 async def test_update_photo_details_firestore_error(
-    client: TestClient, mocker, auth_headers, common_headers
+    async_client: httpx.AsyncClient, photo_service_mocks, override_auth, common_headers
 ):
     """Test PUT /photos/{photo_id} when firestore service fails."""
-    mock_get_item_svc = mocker.patch(
-        "services.firestore_service.get_item_by_id", new_callable=AsyncMock
-    )
+    mock_get_item_svc = photo_service_mocks.get_item
     mock_get_item_svc.return_value = sample_item_with_photo
 
-    mock_update_details = mocker.patch(
-        "services.firestore_service.update_photo_details_in_item",
-        new_callable=AsyncMock,
-    )
+    mock_update_details = photo_service_mocks.update_details
     mock_update_details.side_effect = Exception("Firestore update failed")
 
-    headers = {**common_headers, **auth_headers}
-    response = client.put(
+    response = await async_client.put(
         f"/api/items/{TEST_ITEM_ID_1}/photos/{EXISTING_PHOTO_ID}",
         json=photo_update_payload,
-        headers=headers,
+        headers=common_headers,
     )
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
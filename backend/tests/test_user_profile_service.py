@@ -7,31 +7,38 @@ This module tests:
 - Error handling scenarios
 """
 
+import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock
 
 import pytest
-from google.cloud import firestore
 
-from services.user_profile_service import UserProfileService
+from services.user_profile_service import (
+    MAX_BATCH_WRITES,
+    USERS_COLLECTION,
+    UserProfileService,
+)
 
+_PROFILE_DATA = {
+    "uid": "test_user_123",
+    "email": "test@example.com",
+    "displayName": "Test User",
+}
 
-class TestUserProfileService:
-    """Test UserProfileService functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_db = Mock()
+@pytest.fixture(scope="module")
+def service(_firestore_mock_template):
+    """Build one UserProfileService over the shared mock Firestore client."""
+    db = _firestore_mock_template.db
+    return UserProfileService(firestore_client_factory=lambda: (db, "test_database"))
 
-        # Opening move: create mock Firestore client factory
-        def mock_firestore_client_factory():
-            return (self.mock_db, "test_database")
 
-        self.service = UserProfileService(
-            firestore_client_factory=mock_firestore_client_factory
-        )
+class TestUserProfileService:
+    """Test UserProfileService functionality."""
 
-    async def test_sync_user_profile_new_user(self):
+    async def test_sync_user_profile_new_user(
+        self, service, make_firestore_mocks, frozen_utcnow
+    ):
         """Test syncing profile for a new user."""
         # Opening move: setup user info for new user
         user_info = {
@@ -43,16 +50,10 @@ class TestUserProfileService:
         }
 
         # Mock Firestore to return no existing profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = False
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-        mock_doc_ref.set = AsyncMock()
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+        db, doc_ref, _ = make_firestore_mocks(exists=False)
 
         # Main play: sync user profile
-        result = await self.service.sync_user_profile(user_info)
+        result = await service.sync_user_profile(user_info)
 
         # Victory lap: verify new profile was created
         assert result["uid"] == "new_user_123"
@@ -60,15 +61,15 @@ class TestUserProfileService:
         assert result["displayName"] == "New User"
         assert result["photoURL"] == "https://example.com/photo.jpg"
         assert result["emailVerified"] is True
-        assert "createdAt" in result
-        assert "lastLoginAt" in result
-        assert "updatedAt" in result
+        assert result["createdAt"] == frozen_utcnow
+        assert result["lastLoginAt"] == frozen_utcnow
+        assert result["updatedAt"] == frozen_utcnow
 
         # Verify Firestore operations
-        self.mock_db.collection.assert_called_with("users")
-        mock_doc_ref.set.assert_called_once()
+        assert db.collection.call_args.args == (USERS_COLLECTION,)
+        doc_ref.set.assert_called_once()
 
-    async def test_sync_user_profile_existing_user(self):
+    async def test_sync_user_profile_existing_user(self, service, make_firestore_mocks):
         """Test syncing profile for an existing user."""
         # Setup existing user profile
         user_info = {
@@ -86,17 +87,10 @@ class TestUserProfileService:
         }
 
         # Mock Firestore to return existing profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = True
-        mock_doc.to_dict.return_value = existing_profile
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-        mock_doc_ref.update = AsyncMock()
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+        _, doc_ref, _ = make_firestore_mocks(exists=True, payload=existing_profile)
 
         # Sync user profile
-        result = await self.service.sync_user_profile(user_info)
+        result = await service.sync_user_profile(user_info)
 
         # Verify profile was updated
         assert result["displayName"] == "Updated Name"
@@ -105,209 +99,194 @@ class TestUserProfileService:
         assert "updatedAt" in result
 
         # Verify Firestore update was called
-        mock_doc_ref.update.assert_called_once()
-
-    async def test_sync_user_profile_missing_uid(self):
-        """Test syncing profile when UID is missing."""
-        user_info = {
-            "email": "test@example.com",
-            "name": "Test User",
-        }
-
-        with pytest.raises(ValueError) as exc_info:
-            await self.service.sync_user_profile(user_info)
-
-        assert "User ID is required for profile sync" in str(exc_info.value)
-
-    async def test_sync_user_profile_firestore_error(self):
-        """Test syncing profile when Firestore operation fails."""
-        user_info = {
-            "uid": "test_user_123",
-            "email": "test@example.com",
-        }
-
-        # Mock Firestore to raise an error
-        mock_doc_ref = Mock()
-        mock_doc_ref.get = AsyncMock(side_effect=Exception("Firestore error"))
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        with pytest.raises(Exception) as exc_info:
-            await self.service.sync_user_profile(user_info)
-
-        assert "Firestore error" in str(exc_info.value)
-
-    async def test_get_user_profile_exists(self):
-        """Test getting an existing user profile."""
-        profile_data = {
-            "uid": "test_user_123",
-            "email": "test@example.com",
-            "displayName": "Test User",
-        }
-
-        # Mock Firestore to return profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = True
-        mock_doc.to_dict.return_value = profile_data
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        result = await self.service.get_user_profile("test_user_123")
-
-        assert result == profile_data
-
-    async def test_get_user_profile_not_found(self):
-        """Test getting a non-existent user profile."""
-        # Mock Firestore to return no profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = False
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        result = await self.service.get_user_profile("nonexistent_user")
-
-        assert result is None
-
-    async def test_delete_user_profile_exists(self):
-        """Test deleting an existing user profile."""
-        # Mock Firestore to return existing profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = True
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-        mock_doc_ref.delete = AsyncMock()
+        doc_ref.update.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "method,args,failing_call,expected_exc,match",
+        [
+            (
+                "sync_user_profile",
+                ({"email": "test@example.com", "name": "Test User"},),
+                None,
+                ValueError,
+                "User ID is required for profile sync",
+            ),
+            (
+                "sync_user_profile",
+                ({"uid": "test_user_123", "email": "test@example.com"},),
+                "get",
+                Exception,
+                "Firestore error",
+            ),
+            (
+                "set_admin_status",
+                ("test_user_123", True),
+                "update",
+                Exception,
+                "Firestore error",
+            ),
+        ],
+        ids=["sync_missing_uid", "sync_firestore_error", "set_admin_firestore_error"],
+    )
+    async def test_error_paths_raise(
+        self,
+        service,
+        make_firestore_mocks,
+        method,
+        args,
+        failing_call,
+        expected_exc,
+        match,
+    ):
+        """Test that validation and Firestore failures propagate to the caller."""
+        _, doc_ref, _ = make_firestore_mocks()
+        if failing_call:
+            getattr(doc_ref, failing_call).side_effect = Exception("Firestore error")
+
+        with pytest.raises(expected_exc, match=match):
+            await getattr(service, method)(*args)
+
+    @pytest.mark.parametrize(
+        "exists,expected",
+        [(True, _PROFILE_DATA), (False, None)],
+        ids=["exists", "not_found"],
+    )
+    async def test_get_user_profile(
+        self, service, make_firestore_mocks, exists, expected
+    ):
+        """Test getting a user profile that does or doesn't exist."""
+        make_firestore_mocks(exists=exists, payload=_PROFILE_DATA)
+
+        result = await service.get_user_profile("test_user_123")
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "exists,expected_deletes",
+        [(True, 1), (False, 0)],
+        ids=["exists", "not_found"],
+    )
+    async def test_delete_user_profile(
+        self, service, make_firestore_mocks, exists, expected_deletes
+    ):
+        """Test deleting a user profile that does or doesn't exist."""
+        _, doc_ref, _ = make_firestore_mocks(exists=exists)
+
+        result = await service.delete_user_profile("test_user_123")
+
+        assert result is exists
+        assert doc_ref.delete.await_count == expected_deletes
+
+    @pytest.mark.parametrize(
+        "exists,profile_data,get_error,expected",
+        [
+            (True, {"uid": "admin_user_123", "isAdmin": True}, None, True),
+            (True, {"uid": "regular_user_123", "isAdmin": False}, None, False),
+            (False, None, None, False),
+            # Firestore errors fail closed
+            (None, None, Exception("Firestore error"), False),
+        ],
+        ids=["admin", "regular", "no_profile", "error"],
+    )
+    async def test_is_admin_user(
+        self, service, make_firestore_mocks, exists, profile_data, get_error, expected
+    ):
+        """Test checking admin status across profile and error cases."""
+        make_firestore_mocks(exists=exists, payload=profile_data, get_error=get_error)
+
+        result = await service.is_admin_user("test_user_123")
+
+        assert result is expected
+
+    async def test_set_admin_status_true(
+        self, service, make_firestore_mocks, frozen_utcnow
+    ):
+        """Test setting admin status to True."""
+        _, doc_ref, _ = make_firestore_mocks()
 
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+        await service.set_admin_status("test_user_123", True)
 
-        result = await self.service.delete_user_profile("test_user_123")
+        # Verify update was called with admin status
+        doc_ref.update.assert_called_once()
+        update_data = doc_ref.update.call_args[0][0]
+        assert update_data["isAdmin"] is True
+        assert update_data["updatedAt"] == frozen_utcnow
 
-        assert result is True
-        mock_doc_ref.delete.assert_called_once()
+    async def test_set_admin_status_false(self, service, make_firestore_mocks):
+        """Test setting admin status to False."""
+        _, doc_ref, _ = make_firestore_mocks()
 
-    async def test_delete_user_profile_not_found(self):
-        """Test deleting a non-existent user profile."""
-        # Mock Firestore to return no profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = False
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
+        await service.set_admin_status("test_user_123", False)
 
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+        # Verify update was called with non-admin status
+        doc_ref.update.assert_called_once()
+        update_data = doc_ref.update.call_args[0][0]
+        assert update_data["isAdmin"] is False
 
-        result = await self.service.delete_user_profile("nonexistent_user")
+    async def test_set_admin_status_bulk_batches_writes(
+        self, service, firestore_mocks, frozen_utcnow
+    ):
+        """Test bulk admin updates are committed in batches of MAX_BATCH_WRITES."""
+        admin_flags = {f"user_{i}": i % 2 == 0 for i in range(2 * MAX_BATCH_WRITES + 1)}
+        batch = firestore_mocks.batch
 
-        assert result is False
+        await service.set_admin_status_bulk(admin_flags)
 
-    async def test_is_admin_user_true(self):
-        """Test checking admin status for admin user."""
-        profile_data = {
-            "uid": "admin_user_123",
-            "email": "admin@example.com",
+        # Three batches: two full ones and one holding the last update
+        assert firestore_mocks.db.batch.call_count == 3
+        assert batch.commit.await_count == 3
+        assert batch.update.call_count == len(admin_flags)
+        assert batch.update.call_args.args[1] == {
             "isAdmin": True,
+            "updatedAt": frozen_utcnow,
         }
 
-        # Mock Firestore to return admin profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = True
-        mock_doc.to_dict.return_value = profile_data
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        result = await self.service.is_admin_user("admin_user_123")
-
-        assert result is True
-
-    async def test_is_admin_user_false(self):
-        """Test checking admin status for regular user."""
-        profile_data = {
-            "uid": "regular_user_123",
-            "email": "user@example.com",
-            "isAdmin": False,
-        }
-
-        # Mock Firestore to return regular user profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = True
-        mock_doc.to_dict.return_value = profile_data
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        result = await self.service.is_admin_user("regular_user_123")
-
-        assert result is False
-
-    async def test_is_admin_user_no_profile(self):
-        """Test checking admin status when user profile doesn't exist."""
-        # Mock Firestore to return no profile
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = False
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        result = await self.service.is_admin_user("nonexistent_user")
-
-        assert result is False
-
-    async def test_is_admin_user_error(self):
-        """Test checking admin status when Firestore error occurs."""
-        # Mock Firestore to raise an error
-        mock_doc_ref = Mock()
-        mock_doc_ref.get = AsyncMock(side_effect=Exception("Firestore error"))
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        result = await self.service.is_admin_user("test_user_123")
-
-        # Should return False on error (fail closed)
-        assert result is False
-
-    async def test_set_admin_status_true(self):
-        """Test setting admin status to True."""
-        mock_doc_ref = Mock()
-        mock_doc_ref.update = AsyncMock()
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        await self.service.set_admin_status("test_user_123", True)
-
-        # Verify update was called with admin status
-        mock_doc_ref.update.assert_called_once()
-        update_data = mock_doc_ref.update.call_args[0][0]
-        assert update_data["isAdmin"] is True
-        assert "updatedAt" in update_data
-
-    async def test_set_admin_status_false(self):
-        """Test setting admin status to False."""
-        mock_doc_ref = Mock()
-        mock_doc_ref.update = AsyncMock()
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
-
-        await self.service.set_admin_status("test_user_123", False)
+    async def test_sync_user_profile_concurrent_fan_out(
+        self, service, make_firestore_mocks
+    ):
+        """Test many profile syncs can run concurrently under asyncio.gather."""
+        users = [
+            {"uid": f"user_{i}", "email": f"user{i}@example.com"} for i in range(40)
+        ]
+        _, doc_ref, _ = make_firestore_mocks(exists=False)
+
+        # Track how many writes are in flight at once
+        in_flight = peak = 0
+
+        async def slow_set(profile_data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        doc_ref.set.side_effect = slow_set
+
+        results = await asyncio.gather(
+            *(service.sync_user_profile(user) for user in users)
+        )
 
-        # Verify update was called with non-admin status
-        mock_doc_ref.update.assert_called_once()
-        update_data = mock_doc_ref.update.call_args[0][0]
-        assert update_data["isAdmin"] is False
+        assert [r["uid"] for r in results] == [u["uid"] for u in users]
+        assert doc_ref.set.await_count == len(users)
+        # Writes overlapped instead of running one after another
+        assert peak > 1
 
-    async def test_set_admin_status_error(self):
-        """Test setting admin status when Firestore error occurs."""
-        mock_doc_ref = Mock()
-        mock_doc_ref.update = AsyncMock(side_effect=Exception("Firestore error"))
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+    async def test_firestore_client_factory_called_once(self, make_firestore_mocks):
+        """Test the service asks its factory for a client once and reuses it."""
+        db, _, _ = make_firestore_mocks(exists=True, payload=_PROFILE_DATA)
+        factory = Mock(return_value=(db, "test_database"))
+        service = UserProfileService(firestore_client_factory=factory)
 
-        with pytest.raises(Exception) as exc_info:
-            await self.service.set_admin_status("test_user_123", True)
+        for _ in range(3):
+            await service.sync_user_profile(_PROFILE_DATA)
+            await service.get_user_profile("test_user_123")
+            await service.is_admin_user("test_user_123")
 
-        assert "Firestore error" in str(exc_info.value)
+        factory.assert_called_once_with()
 
-    async def test_sync_user_profile_filters_none_values(self):
+    async def test_sync_user_profile_filters_none_values(
+        self, service, make_firestore_mocks
+    ):
         """Test that sync_user_profile filters out None values properly."""
         user_info = {
             "uid": "test_user_123",
@@ -324,20 +303,13 @@ class TestUserProfileService:
             "displayName": "Old Name",
         }
 
-        mock_doc_ref = Mock()
-        mock_doc = Mock()
-        mock_doc.exists = True
-        mock_doc.to_dict.return_value = existing_profile
-        mock_doc_ref.get = AsyncMock(return_value=mock_doc)
-        mock_doc_ref.update = AsyncMock()
-
-        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+        _, doc_ref, _ = make_firestore_mocks(exists=True, payload=existing_profile)
 
-        await self.service.sync_user_profile(user_info)
+        await service.sync_user_profile(user_info)
 
         # Verify update was called and None values were filtered out
-        mock_doc_ref.update.assert_called_once()
-        update_data = mock_doc_ref.update.call_args[0][0]
+        doc_ref.update.assert_called_once()
+        update_data = doc_ref.update.call_args[0][0]
 
         # These should be present
         assert "email" in update_data
@@ -0,0 +1,33 @@
+"""FastAPI helpers shared by the authentication tests.
+
+This module provides:
+- Status code and header constants the auth dependencies respond with
+- Factories for the HTTPExceptions raised on authentication failures
+"""
+
+from types import MappingProxyType
+
+from fastapi import HTTPException, status
+
+HTTP_401 = status.HTTP_401_UNAUTHORIZED
+# Read-only: shared by every test; unauthorized_exc hands each exception a copy
+BEARER_CHALLENGE = MappingProxyType({"WWW-Authenticate": "Bearer"})
+
+
+def unauthorized_exc(detail: str) -> HTTPException:
+    """Create the 401 HTTPException raised for a rejected Bearer token.
+
+    Args:
+        detail: Error detail returned to the client
+
+    Returns:
+        HTTPException with a 401 status and a Bearer challenge header
+    """
+    return HTTPException(
+        status_code=HTTP_401, detail=detail, headers=dict(BEARER_CHALLENGE)
+    )
+
+
+def invalid_token_exc() -> HTTPException:
+    """Create the HTTPException raised for an invalid Firebase ID token."""
+    return unauthorized_exc("Invalid authentication token")
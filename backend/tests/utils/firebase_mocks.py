@@ -6,13 +6,20 @@ This module provides:
 - Utilities for mocking Firebase Admin SDK functions
 """
 
+import functools
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Optional
-from unittest.mock import Mock
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
+import httpx
 import pytest
+from fastapi import HTTPException
 from firebase_admin import auth
 
+# One clock reading for all test tokens and profiles built from this module
+_NOW = datetime.utcnow()
+
 
 class MockFirebaseToken:
     """Mock Firebase ID token for testing."""
@@ -32,11 +39,12 @@ class MockFirebaseToken:
         self.name = name
         self.picture = picture
         self.email_verified = email_verified
-        self.exp = exp or datetime.utcnow() + timedelta(hours=1)
-        self.iat = iat or datetime.utcnow()
+        self.exp = exp or _NOW + timedelta(hours=1)
+        self.iat = iat or _NOW
 
-    def to_dict(self) -> Dict[str, any]:
-        """Convert to dictionary format matching Firebase token payload."""
+    @functools.cached_property
+    def _payload(self) -> Mapping[str, Any]:
+        """Token payload, built once per token since test tokens never change."""
         token_data = {
             "uid": self.uid,
             "email": self.email,
@@ -51,27 +59,52 @@ class MockFirebaseToken:
         if self.picture:
             token_data["picture"] = self.picture
 
-        return token_data
+        return MappingProxyType(token_data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format matching Firebase token payload.
+
+        Returns a fresh copy of the cached payload, so callers may mutate it.
+        """
+        return dict(self._payload)
 
 
+@dataclass(slots=True, frozen=True)
 class MockUserRecord:
-    """Mock Firebase UserRecord for testing."""
+    """Mock Firebase UserRecord for testing.
+
+    Immutable, so a single instance can be shared across tests.
+    """
+
+    uid: str = "test_user_123"
+    email: Optional[str] = "test@example.com"
+    display_name: Optional[str] = "Test User"
+    photo_url: Optional[str] = None
+    email_verified: bool = True
+    disabled: bool = False
 
-    def __init__(
-        self,
-        uid: str = "test_user_123",
-        email: str = "test@example.com",
-        display_name: Optional[str] = "Test User",
-        photo_url: Optional[str] = None,
-        email_verified: bool = True,
-        disabled: bool = False,
-    ):
-        self.uid = uid
-        self.email = email
-        self.display_name = display_name
-        self.photo_url = photo_url
-        self.email_verified = email_verified
-        self.disabled = disabled
+
+@functools.cache
+def admin_user_record(uid: str = "new_admin_uid") -> MockUserRecord:
+    """Return the shared UserRecord for the admin account with the given UID.
+
+    Args:
+        uid: Firebase UID of the admin user
+
+    Returns:
+        Cached MockUserRecord for admin@potteryapp.test
+    """
+    return MockUserRecord(
+        uid=uid, email="admin@potteryapp.test", display_name="Administrator"
+    )
+
+
+class MockUserNotFoundError(Exception):
+    """Stand-in for auth.UserNotFoundError when core.firebase.auth is mocked."""
+
+
+class MockEmailAlreadyExistsError(Exception):
+    """Stand-in for auth.EmailAlreadyExistsError when core.firebase.auth is mocked."""
 
 
 # Test data fixtures
@@ -79,33 +112,37 @@ VALID_FIREBASE_TOKEN = MockFirebaseToken()
 ADMIN_FIREBASE_TOKEN = MockFirebaseToken(
     uid="admin_user_456", email="admin@potteryapp.test", name="Admin User"
 )
-EXPIRED_FIREBASE_TOKEN = MockFirebaseToken(exp=datetime.utcnow() - timedelta(hours=1))
+EXPIRED_FIREBASE_TOKEN = MockFirebaseToken(exp=_NOW - timedelta(hours=1))
 
 
-def create_mock_firebase_auth():
-    """Create a mock Firebase auth module for testing."""
-    mock_auth = Mock()
+# Canned verify_id_token outcomes, looked up instead of walking an if/elif chain
+_TOKENS = {"valid_token": VALID_FIREBASE_TOKEN, "admin_token": ADMIN_FIREBASE_TOKEN}
+_TOKEN_ERRORS = {
+    "expired_token": (auth.ExpiredIdTokenError, "Token has expired"),
+    "invalid_token": (auth.InvalidIdTokenError, "Invalid token format"),
+    "revoked_token": (auth.RevokedIdTokenError, "Token has been revoked"),
+}
 
-    # Configure verify_id_token method
-    def mock_verify_id_token(token: str) -> Dict[str, any]:
-        """Mock Firebase token verification."""
-        if token == "valid_token":
-            return VALID_FIREBASE_TOKEN.to_dict()
-        elif token == "admin_token":
-            return ADMIN_FIREBASE_TOKEN.to_dict()
-        elif token == "expired_token":
-            raise auth.ExpiredIdTokenError("Token has expired")
-        elif token == "invalid_token":
-            raise auth.InvalidIdTokenError("Invalid token format")
-        elif token == "revoked_token":
-            raise auth.RevokedIdTokenError("Token has been revoked")
-        else:
-            raise auth.InvalidIdTokenError("Unknown token")
 
-    mock_auth.verify_id_token = mock_verify_id_token
+class MockFirebaseAuth:
+    """Stand-in for the firebase_admin.auth module with canned responses."""
 
-    # Configure get_user_by_email method
-    def mock_get_user_by_email(email: str) -> MockUserRecord:
+    InvalidIdTokenError = auth.InvalidIdTokenError
+    ExpiredIdTokenError = auth.ExpiredIdTokenError
+    RevokedIdTokenError = auth.RevokedIdTokenError
+    UserNotFoundError = auth.UserNotFoundError
+    EmailAlreadyExistsError = auth.EmailAlreadyExistsError
+
+    def verify_id_token(self, token: str) -> Dict[str, Any]:
+        """Mock Firebase token verification."""
+        if token in _TOKENS:
+            return _TOKENS[token].to_dict()
+        error_type, message = _TOKEN_ERRORS.get(
+            token, (auth.InvalidIdTokenError, "Unknown token")
+        )
+        raise error_type(message)
+
+    def get_user_by_email(self, email: str) -> MockUserRecord:
         """Mock Firebase get user by email."""
         if email == "test@example.com":
             return MockUserRecord()
@@ -118,10 +155,7 @@ def create_mock_firebase_auth():
         else:
             raise auth.UserNotFoundError("User not found")
 
-    mock_auth.get_user_by_email = mock_get_user_by_email
-
-    # Configure create_user method
-    def mock_create_user(**kwargs) -> MockUserRecord:
+    def create_user(self, **kwargs) -> MockUserRecord:
         """Mock Firebase user creation."""
         email = kwargs.get("email")
         if email == "existing@example.com":
@@ -134,16 +168,38 @@ def create_mock_firebase_auth():
             email_verified=kwargs.get("email_verified", False),
         )
 
-    mock_auth.create_user = mock_create_user
 
-    # Add exception classes
-    mock_auth.InvalidIdTokenError = auth.InvalidIdTokenError
-    mock_auth.ExpiredIdTokenError = auth.ExpiredIdTokenError
-    mock_auth.RevokedIdTokenError = auth.RevokedIdTokenError
-    mock_auth.UserNotFoundError = auth.UserNotFoundError
-    mock_auth.EmailAlreadyExistsError = auth.EmailAlreadyExistsError
+@dataclass(slots=True, frozen=True)
+class MockFirebaseApp:
+    """Mock Firebase App for testing."""
 
-    return mock_auth
+    project_id: str = "test-project"
+
+
+class MockUserProfileService:
+    """Stand-in for UserProfileService that never touches Firestore."""
+
+    async def sync_user_profile(self, user_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a basic profile built from the Firebase user info."""
+        return {
+            "uid": user_info["uid"],
+            "email": user_info.get("email"),
+            "displayName": user_info.get("name"),
+            "photoURL": user_info.get("picture"),
+            "emailVerified": user_info.get("email_verified", False),
+            "createdAt": _NOW,
+            "lastLoginAt": _NOW,
+            "updatedAt": _NOW,
+        }
+
+    async def is_admin_user(self, uid: str) -> bool:
+        """Report admin status based on UID."""
+        return uid == "admin_user_456"
+
+
+def create_mock_firebase_auth() -> MockFirebaseAuth:
+    """Create a mock Firebase auth module for testing."""
+    return MockFirebaseAuth()
 
 
 @pytest.fixture
@@ -155,9 +211,7 @@ def mock_firebase_auth():
 @pytest.fixture
 def mock_firebase_app():
     """Pytest fixture for mocked Firebase app."""
-    mock_app = Mock()
-    mock_app.project_id = "test-project"
-    return mock_app
+    return MockFirebaseApp()
 
 
 @pytest.fixture
@@ -175,42 +229,68 @@ def admin_firebase_token_data():
 @pytest.fixture
 def mock_user_profile_service():
     """Pytest fixture for mocked UserProfileService."""
-    mock_service = Mock()
+    return MockUserProfileService()
 
-    # Mock sync_user_profile to return basic profile data
-    async def mock_sync_user_profile(user_info: Dict[str, any]) -> Dict[str, any]:
-        return {
-            "uid": user_info["uid"],
-            "email": user_info.get("email"),
-            "displayName": user_info.get("name"),
-            "photoURL": user_info.get("picture"),
-            "emailVerified": user_info.get("email_verified", False),
-            "createdAt": datetime.utcnow(),
-            "lastLoginAt": datetime.utcnow(),
-            "updatedAt": datetime.utcnow(),
-        }
 
-    mock_service.sync_user_profile = mock_sync_user_profile
+@functools.lru_cache(maxsize=32)
+def create_test_auth_headers(token: str = "valid_token") -> Mapping[str, str]:
+    """Create test authentication headers with Bearer token.
+
+    Results are cached per token and returned read-only, so repeated calls
+    share one mapping.
 
-    # Mock is_admin_user to return admin status based on UID
-    async def mock_is_admin_user(uid: str) -> bool:
-        return uid == "admin_user_456"
+    Args:
+        token: The token to include in Authorization header
 
-    mock_service.is_admin_user = mock_is_admin_user
+    Returns:
+        Read-only mapping with Authorization header
+    """
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
 
-    return mock_service
 
+def async_return(value):
+    """Create a coroutine function that always resolves to the given value.
 
-def create_test_auth_headers(token: str = "valid_token") -> Dict[str, str]:
-    """Create test authentication headers with Bearer token.
+    Lighter than AsyncMock when a test only needs an awaitable result. Wrap it
+    in ``Mock(side_effect=async_return(value))`` to keep call assertions.
 
     Args:
-        token: The token to include in Authorization header
+        value: The value the returned coroutine function resolves to
 
     Returns:
-        Dict with Authorization header
+        Async callable accepting any arguments
     """
-    return {"Authorization": f"Bearer {token}"}
+
+    async def _coro(*args, **kwargs):
+        return value
+
+    return _coro
+
+
+def create_auth_mock_transport(auth_dependency) -> httpx.MockTransport:
+    """Create an httpx transport that answers requests with an auth dependency.
+
+    The Bearer token is passed straight to the dependency, so auth-only tests
+    exercise the real authentication logic without ASGI routing or middleware.
+
+    Args:
+        auth_dependency: Async callable taking a token and returning a User
+
+    Returns:
+        MockTransport responding 200 with the user, or the HTTPException status
+    """
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        try:
+            user = await auth_dependency(token)
+        except HTTPException as e:
+            return httpx.Response(
+                e.status_code, json={"detail": e.detail}, headers=e.headers
+            )
+        return httpx.Response(200, json=user.model_dump())
+
+    return httpx.MockTransport(handler)
 
 
 def create_firebase_error_scenarios():